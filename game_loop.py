@@ -0,0 +1,116 @@
+"""Boucle de jeu à pas de temps fixe pour les jeux Tk."""
+import time
+
+
+class FixedTimestepLoop:
+    """Fait avancer la logique par pas constants et rafraîchit l'affichage à chaque image.
+
+    `update()` est appelé autant de fois que nécessaire pour rattraper le temps
+    réellement écoulé (dans la limite de `max_steps_per_frame`), puis
+    `render(alpha)` reçoit la fraction du pas suivant déjà écoulée, entre 0 et 1,
+    pour interpoler les positions. La durée d'un tick ne dépend donc plus du
+    temps de rendu.
+    """
+
+    def __init__(self, root, update, render, step_ms, frame_ms=16, max_steps_per_frame=5,
+                 clock=time.perf_counter):
+        self.root = root
+        self.update = update
+        self.render = render
+        self.step_ms = step_ms
+        self.frame_ms = frame_ms
+        self.max_steps_per_frame = max_steps_per_frame
+        self.clock = clock
+
+        self.running = False
+        self.paused = False
+        self.accumulator = 0.0
+        self.last_time = None
+        self._after_id = None
+        self._hold_id = None
+
+    def start(self):
+        """Démarre (ou redémarre) la boucle"""
+        self.stop()
+        self.running = True
+        self.paused = False
+        self._reset_clock()
+        self._schedule()
+
+    def stop(self):
+        """Arrête la boucle et annule les rappels en attente"""
+        self.running = False
+        self._cancel()
+        if self._hold_id is not None:
+            self.root.after_cancel(self._hold_id)
+            self._hold_id = None
+
+    def pause(self):
+        """Suspend la logique et l'affichage sans perdre l'état de la boucle"""
+        self.paused = True
+        self._cancel()
+
+    def resume(self):
+        """Reprend après pause() sans rattraper le temps passé en pause"""
+        self.paused = False
+        if self.running and self._hold_id is None and self._after_id is None:
+            self._reset_clock()
+            self._schedule()
+
+    def hold(self, duration_ms, callback=None):
+        """Suspend la boucle pendant `duration_ms` sans bloquer Tk, puis reprend.
+
+        Utile pour les transitions (changement de niveau, message...) : les
+        événements clavier et l'affichage de Tk continuent d'être traités. Une
+        pause demandée pendant l'attente reste active à la fin de celle-ci.
+        """
+        if not self.running:
+            return
+        self._cancel()
+
+        def release():
+            self._hold_id = None
+            if callback is not None:
+                callback()
+            if self.running and not self.paused:
+                self._reset_clock()
+                self._schedule()
+
+        self._hold_id = self.root.after(duration_ms, release)
+
+    def _reset_clock(self):
+        self.accumulator = 0.0
+        self.last_time = self.clock()
+
+    def _schedule(self):
+        self._after_id = self.root.after(self.frame_ms, self._frame)
+
+    def _cancel(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _frame(self):
+        self._after_id = None
+        if not self.running or self.paused:
+            return
+
+        now = self.clock()
+        self.accumulator += (now - self.last_time) * 1000
+        self.last_time = now
+
+        # Rattraper le retard par pas fixes
+        steps = 0
+        while self.accumulator >= self.step_ms:
+            self.update()
+            self.accumulator -= self.step_ms
+            steps += 1
+            if not self.running or self.paused or self._hold_id is not None:
+                return
+            if steps >= self.max_steps_per_frame:
+                # Trop de retard (machine surchargée) : abandonner le reste
+                self.accumulator = 0.0
+                break
+
+        self.render(self.accumulator / self.step_ms)
+        self._schedule()
@@ -63,6 +63,13 @@ class GameMenu:
                 "class": "TetrisGame",
                 "thumbnail": self.create_tetris_thumbnail()
             },
+            {
+                "name": "Tetris Versus",
+                "description": "Battle the AI or a friend: cleared lines send garbage to the next board",
+                "module": "tetris_versus",
+                "class": "VersusGame",
+                "thumbnail": self.create_tetris_thumbnail()
+            },
             {
                 "name": "Space Invaders",
                 "description": "Defend Earth from waves of alien invaders",
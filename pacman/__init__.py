@@ -0,0 +1,28 @@
+"""Pac-Man : règles (rules), fantômes et stratégies (ai), labyrinthes (assets), affichage Tk (render).
+
+Les sous-modules sont importés à la demande : les simulations sans affichage
+(pacman.batch, pacman.replay) ne chargent ni Tk ni PIL.
+"""
+import importlib
+
+# Nom exporté -> sous-module qui le définit
+_EXPORTS = {
+    "PacManGame": "render",
+    "Camera": "render",
+    "main": "render",
+    "PacManState": "rules",
+    "LEVEL_CONFIGS": "rules",
+    "Maze": "assets",
+    "Replay": "replay",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Les accès suivants ne passent plus par __getattr__
+    return value
@@ -0,0 +1,308 @@
+"""Intelligence des fantômes (graphe de navigation, plus courts chemins) et stratégies de Pac-Man."""
+import math
+from .assets import WALL, DOT, POWER, BLOCKS_PACMAN
+
+# Directions de déplacement (ligne, colonne) et bit associé dans les masques de navigation
+DIRECTIONS = {"Up": (-1, 0), "Down": (1, 0), "Left": (0, -1), "Right": (0, 1)}
+DIRECTION_BITS = {"Up": 1, "Down": 2, "Left": 4, "Right": 8}
+OPPOSITE_DIRECTION = {"Up": "Down", "Down": "Up", "Left": "Right", "Right": "Left"}
+
+# Directions praticables pour chacun des 16 masques possibles
+MASK_DIRECTIONS = [
+    tuple(direction for direction, bit in DIRECTION_BITS.items() if mask & bit)
+    for mask in range(16)
+]
+
+# Champs de distance déjà calculés, par disposition des murs puis par case source.
+# Les labyrinthes étant statiques, chaque BFS n'est faite qu'une fois par partie.
+_DISTANCE_FIELDS = {}
+UNREACHABLE = 1 << 30
+
+
+class GhostAI:
+    """Déplacement des fantômes, mélangé à PacManState (utilise son labyrinthe et ses fantômes)"""
+
+    def get_valid_directions(self, pos):
+        """Retourne les directions valides depuis une position donnée"""
+        row, col = int(round(pos[0])), int(round(pos[1]))
+        return list(MASK_DIRECTIONS[self.nav_mask[row * self.GRID_WIDTH + col]])
+
+    def get_direction_to_target(self, ghost_pos, target_pos):
+        dx = target_pos[0] - ghost_pos[0]
+        dy = target_pos[1] - ghost_pos[1]
+        if abs(dx) > abs(dy):
+            return 'Down' if dx > 0 else 'Up'
+        else:
+            return 'Right' if dy > 0 else 'Left'
+
+    def build_navigation(self):
+        """Précalcule le graphe de navigation des fantômes pour le labyrinthe courant"""
+        # Pour chaque case : masque des directions praticables et case voisine
+        # correspondante (tunnels compris), indexés comme les cases du labyrinthe.
+        # Les fantômes traversent tout sauf les murs.
+        width = self.GRID_WIDTH
+        cells = self.maze.cells
+        self.nav_mask = bytearray(len(cells))
+        self.nav_neighbors = [{} for _ in range(len(cells))]
+        self.nav_junctions = []
+        self.nav_tunnels = []
+        
+        for row in range(self.GRID_HEIGHT):
+            for col in range(width):
+                index = row * width + col
+                if cells[index] == WALL:
+                    continue
+                mask = 0
+                neighbors = self.nav_neighbors[index]
+                for direction, (d_row, d_col) in DIRECTIONS.items():
+                    next_r = row + d_row
+                    next_c = (col + d_col) % width  # Gérer le tunnel
+                    if not 0 <= next_r < self.GRID_HEIGHT or cells[next_r * width + next_c] == WALL:
+                        continue
+                    mask |= DIRECTION_BITS[direction]
+                    neighbors[direction] = (next_r, next_c)
+                    if next_c != col + d_col:
+                        self.nav_tunnels.append(((row, col), (next_r, next_c)))
+                self.nav_mask[index] = mask
+                
+                # Une intersection offre au moins trois sorties
+                if len(MASK_DIRECTIONS[mask]) >= 3:
+                    self.nav_junctions.append((row, col))
+        
+        # Les champs de distance sont partagés entre labyrinthes de même disposition
+        self.distance_fields = _DISTANCE_FIELDS.setdefault(self.maze.layout(), {})
+        self.field_cell = None
+        self.field = None
+
+    def navigation_data(self, text):
+        """Texte du labyrinthe et données dérivées, à mettre en cache sur disque"""
+        return {
+            "text": text,
+            "dots": self.maze.dots,
+            "nav_mask": bytes(self.nav_mask),
+            "nav_neighbors": self.nav_neighbors,
+            "nav_junctions": self.nav_junctions,
+            "nav_tunnels": self.nav_tunnels,
+            "distance_fields": dict(self.distance_fields),
+        }
+
+    def restore_navigation(self, data):
+        """Équivalent de build_navigation à partir de navigation_data()"""
+        self.nav_mask = bytearray(data["nav_mask"])
+        self.nav_neighbors = data["nav_neighbors"]
+        self.nav_junctions = data["nav_junctions"]
+        self.nav_tunnels = data["nav_tunnels"]
+        self.distance_fields = _DISTANCE_FIELDS.setdefault(self.maze.layout(), {})
+        for cell, field in data["distance_fields"].items():
+            self.distance_fields.setdefault(cell, field)
+        self.field_cell = None
+        self.field = None
+
+    def compute_distance_field(self, source):
+        """Parcours en largeur depuis une case : distance en pas vers toutes les autres"""
+        width = self.GRID_WIDTH
+        field = [UNREACHABLE] * (width * self.GRID_HEIGHT)
+        field[source[0] * width + source[1]] = 0
+        frontier = [source]
+        distance = 0
+        
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for row, col in frontier:
+                for next_r, next_c in self.nav_neighbors[row * width + col].values():
+                    index = next_r * width + next_c
+                    if field[index] == UNREACHABLE:
+                        field[index] = distance
+                        next_frontier.append((next_r, next_c))
+            frontier = next_frontier
+        
+        return field
+
+    def precompute_distance_fields(self):
+        """Calcule les plus courts chemins entre toutes les paires de cases praticables"""
+        for row in range(self.GRID_HEIGHT):
+            for col in range(self.GRID_WIDTH):
+                if self.maze.cell(row, col) != WALL and (row, col) not in self.distance_fields:
+                    self.distance_fields[(row, col)] = self.compute_distance_field((row, col))
+
+    def get_distance_field(self, cell):
+        """Retourne le champ de distance depuis une case, calculé au plus une fois"""
+        # Réutiliser le champ du tick précédent si Pac-Man n'a pas changé de case
+        if cell == self.field_cell:
+            return self.field
+        
+        field = self.distance_fields.get(cell)
+        if field is None:
+            field = self.compute_distance_field(cell)
+            self.distance_fields[cell] = field
+        
+        self.field_cell = cell
+        self.field = field
+        return field
+
+    def choose_direction(self, neighbors, directions, target, flee=False, field=None):
+        """Choisit la direction qui rapproche (ou éloigne) le plus de la cible"""
+        best_direction = None
+        best_distance = -1 if flee else float('inf')
+        
+        for direction in directions:
+            next_r, next_c = neighbors[direction]
+            if field is not None:
+                # Longueur du plus court chemin dans le labyrinthe
+                distance = field[next_r * self.GRID_WIDTH + next_c]
+            else:
+                # La distance au carré suffit pour comparer
+                distance = (next_r - target[0])**2 + (next_c - target[1])**2
+            if (distance > best_distance) if flee else (distance < best_distance):
+                best_distance = distance
+                best_direction = direction
+        
+        return best_direction
+
+    def chase_target(self):
+        """Case de Pac-Man et champ de distance depuis celle-ci, partagés par tous les fantômes"""
+        pacman_grid_pos = (int(round(self.pacman_pos[0])), int(round(self.pacman_pos[1])))
+        pacman_grid_pos = (pacman_grid_pos[0], pacman_grid_pos[1] % self.GRID_WIDTH)
+        
+        field = None
+        if self.USE_DISTANCE_FIELD and self.maze.cell(*pacman_grid_pos) != WALL:
+            field = self.get_distance_field(pacman_grid_pos)
+        return pacman_grid_pos, field
+
+    def steer_ghost(self, ghost, pacman_grid_pos, field):
+        """Choisit la direction et la case cible suivante d'un fantôme arrivé sur sa case"""
+        row, col = ghost["target"]
+
+        # Empêcher le demi-tour immédiat, sauf dans un cul-de-sac
+        index = row * self.GRID_WIDTH + col
+        mask = self.nav_mask[index]
+        reverse_bit = DIRECTION_BITS[OPPOSITE_DIRECTION[ghost["direction"]]]
+        if mask & ~reverse_bit:
+            mask &= ~reverse_bit
+        valid_directions = MASK_DIRECTIONS[mask]
+        neighbors = self.nav_neighbors[index]
+
+        if len(valid_directions) == 1:
+            # Dans un couloir, une seule direction possible
+            ghost["direction"] = valid_directions[0]
+        elif valid_directions:
+            # Logique de décision basée sur l'état et le type de fantôme
+            if ghost["vulnerable"]:
+                # En mode vulnérable, s'éloigner de Pac-Man
+                best_direction = self.choose_direction(neighbors, valid_directions, pacman_grid_pos,
+                                                       flee=True, field=field)
+            elif ghost["type"] in ["ghost1", "ghost2"]:  # Rouge et Cyan - poursuite directe
+                best_direction = self.choose_direction(neighbors, valid_directions, pacman_grid_pos,
+                                                       field=field)
+            elif ghost["type"] == "ghost3":  # Rose - tente de se positionner devant Pac-Man
+                # Prédire où Pac-Man sera dans quelques pas
+                d_row, d_col = DIRECTIONS[self.direction]
+                target_pos = (pacman_grid_pos[0] + 4 * d_row, pacman_grid_pos[1] + 4 * d_col)
+                target_field = None
+                if field is not None:
+                    target_field = self.distance_fields.get(target_pos)
+                best_direction = self.choose_direction(neighbors, valid_directions, target_pos,
+                                                       field=target_field)
+            elif self.rng.random() < 0.7:  # Orange - 70% de poursuite, 30% aléatoire
+                best_direction = self.choose_direction(neighbors, valid_directions, pacman_grid_pos,
+                                                       field=field)
+            else:
+                best_direction = self.rng.choice(valid_directions)
+
+            if best_direction:
+                ghost["direction"] = best_direction
+
+        # Calculer la nouvelle position cible (prochaine case de la grille)
+        if ghost["direction"] in neighbors:
+            ghost["target"] = list(neighbors[ghost["direction"]])
+
+    def move_ghosts(self):
+        """Déplace les fantômes dans le labyrinthe"""
+        pacman_grid_pos, field = self.chase_target()
+
+        for ghost in self.ghosts:
+            # Mettre à jour l'état de vulnérabilité du fantôme
+            ghost["vulnerable"] = self.power_mode
+            
+            # Vérifier si le fantôme est exactement sur une case de la grille pour prendre une décision
+            if abs(ghost["pos"][0] - ghost["target"][0]) < 0.1 and abs(ghost["pos"][1] - ghost["target"][1]) < 0.1:
+                # Le fantôme a atteint sa case cible, il peut décider de sa prochaine direction
+                ghost["pos"] = list(ghost["target"])  # Aligner précisément sur la grille
+                self.steer_ghost(ghost, pacman_grid_pos, field)
+
+            # Mouvement fluide vers la cible
+            target_r, target_c = ghost["target"]
+            current_r, current_c = ghost["pos"]
+            move_speed = self.GHOST_SPEED
+            
+            # Calculer le déplacement pour ce tick
+            delta_r = target_r - current_r
+            delta_c = target_c - current_c
+            
+            # Appliquer la vitesse
+            move_r = 0
+            move_c = 0
+            
+            if abs(delta_r) > 0.01:  # Mouvement vertical
+                move_r = math.copysign(min(move_speed, abs(delta_r)), delta_r)
+            if abs(delta_c) > 0.01:  # Mouvement horizontal
+                move_c = math.copysign(min(move_speed, abs(delta_c)), delta_c)
+            
+            ghost["pos"][0] += move_r
+            ghost["pos"][1] += move_c
+            self.place_ghost(ghost)
+
+
+# Stratégies de Pac-Man pour les parties sans affichage (voir pacman.batch)
+def pacman_directions(state):
+    """Retourne les directions que Pac-Man peut prendre depuis sa case actuelle"""
+    row, col = int(round(state.pacman_pos[0])), int(round(state.pacman_pos[1]))
+    directions = []
+    for direction, (d_row, d_col) in DIRECTIONS.items():
+        next_r = row + d_row
+        next_c = (col + d_col) % state.GRID_WIDTH
+        if 0 <= next_r < state.GRID_HEIGHT and not BLOCKS_PACMAN[state.maze.cell(next_r, next_c)]:
+            directions.append(direction)
+    return directions
+
+
+def random_policy(state, rng):
+    """Garde sa direction dans les couloirs et en change au hasard ailleurs"""
+    directions = pacman_directions(state)
+    if not directions:
+        return state.direction
+    if state.direction in directions and len(directions) <= 2 and rng.random() < 0.9:
+        return state.direction
+    return rng.choice(directions)
+
+
+def greedy_policy(state, rng):
+    """Se dirige vers le point le plus proche (parcours en largeur)"""
+    start = (int(round(state.pacman_pos[0])), int(round(state.pacman_pos[1])))
+    first_step = {start: None}
+    frontier = [start]
+
+    while frontier:
+        next_frontier = []
+        for row, col in frontier:
+            if state.maze.cell(row, col) in (DOT, POWER) and first_step[(row, col)] is not None:
+                return first_step[(row, col)]
+            for direction, (d_row, d_col) in DIRECTIONS.items():
+                next_r = row + d_row
+                next_c = (col + d_col) % state.GRID_WIDTH
+                if not 0 <= next_r < state.GRID_HEIGHT or (next_r, next_c) in first_step:
+                    continue
+                if BLOCKS_PACMAN[state.maze.cell(next_r, next_c)]:
+                    continue
+                first_step[(next_r, next_c)] = first_step[(row, col)] or direction
+                next_frontier.append((next_r, next_c))
+        frontier = next_frontier
+
+    return random_policy(state, rng)
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
@@ -0,0 +1,102 @@
+"""Labyrinthes du Pac-Man : types de cases, lecture des fichiers du dossier mazes."""
+import hashlib
+import os
+
+# Types de cases des labyrinthes
+EMPTY, WALL, DOT, POWER, DOOR = range(5)
+
+# Cases infranchissables pour Pac-Man (murs et porte des fantômes), indexées par type
+BLOCKS_PACMAN = (False, True, False, False, True)
+
+# Caractères des fichiers de labyrinthe
+MAZE_CHARS = {" ": EMPTY, "#": WALL, ".": DOT, "o": POWER, "-": DOOR, "P": EMPTY, "G": EMPTY}
+
+# Dossier des labyrinthes et variantes utilisées par "maze_variant" dans LEVEL_CONFIGS
+MAZE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mazes")
+MAZE_VARIANTS = ["classic", "variant1", "variant2"]
+
+# Positions de départ par défaut (ligne, colonne) si le fichier ne les précise pas
+DEFAULT_PACMAN_START = (15, 9)
+DEFAULT_GHOST_HOME = (9, 9)
+
+# Table de traduction ne gardant que les murs, pour identifier une disposition
+_WALLS_ONLY = bytes(1 if cell == WALL else 0 for cell in range(256))
+_STATIC_ONLY = bytes(cell if cell in (WALL, DOOR) else EMPTY for cell in range(256))
+
+# Labyrinthes déjà lus, par nom
+_MAZE_CACHE = {}
+
+
+class Maze:
+    """Labyrinthe stocké ligne par ligne dans un bytearray (case = ligne * width + colonne)"""
+
+    def __init__(self, width, height, cells, pacman_start=DEFAULT_PACMAN_START,
+                 ghost_home=DEFAULT_GHOST_HOME, name=None):
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.pacman_start = pacman_start
+        self.ghost_home = ghost_home
+        self.name = name
+        # Nombre de points restants, tenu à jour par eat()
+        self.dots = cells.count(DOT) + cells.count(POWER)
+
+    @classmethod
+    def parse(cls, text, name=None):
+        """Construit un labyrinthe depuis sa forme texte (lignes commençant par ';' ignorées)"""
+        rows = [line for line in text.splitlines() if not line.startswith(";")]
+        while rows and not rows[-1].strip():
+            rows.pop()
+        if not rows:
+            raise ValueError(f"Labyrinthe {name} vide")
+        
+        # Les espaces de fin de ligne peuvent avoir été supprimés par un éditeur
+        width = max(len(row) for row in rows)
+        cells = bytearray()
+        pacman_start = DEFAULT_PACMAN_START
+        ghost_home = DEFAULT_GHOST_HOME
+        for row_index, row in enumerate(rows):
+            for col_index, char in enumerate(row.ljust(width)):
+                if char not in MAZE_CHARS:
+                    raise ValueError(f"Labyrinthe {name} : caractère {char!r} inconnu "
+                                     f"(ligne {row_index + 1}, colonne {col_index + 1})")
+                if char == "P":
+                    pacman_start = (row_index, col_index)
+                elif char == "G":
+                    ghost_home = (row_index, col_index)
+                cells.append(MAZE_CHARS[char])
+        
+        return cls(width, len(rows), cells, pacman_start, ghost_home, name)
+
+    @classmethod
+    def load(cls, name):
+        """Retourne une copie du labyrinthe `name` (fichier mazes/<name>.txt), lu une seule fois"""
+        template = _MAZE_CACHE.get(name)
+        if template is None:
+            with open(os.path.join(MAZE_DIR, f"{name}.txt"), encoding="utf-8") as f:
+                template = cls.parse(f.read(), name)
+            _MAZE_CACHE[name] = template
+        return template.copy()
+
+    def copy(self):
+        return Maze(self.width, self.height, bytearray(self.cells), self.pacman_start,
+                    self.ghost_home, self.name)
+
+    def cell(self, row, col):
+        return self.cells[row * self.width + col]
+
+    def eat(self, index):
+        """Retire le point de la case `index` et retourne son type"""
+        cell = self.cells[index]
+        self.cells[index] = EMPTY
+        self.dots -= 1
+        return cell
+
+    def layout(self):
+        """Clé identifiant la disposition des murs, indépendamment des points"""
+        return (self.width, bytes(self.cells).translate(_WALLS_ONLY))
+
+    def static_key(self):
+        """Empreinte des éléments fixes (murs et porte), utilisée pour les caches sur disque"""
+        static = bytes(self.cells).translate(_STATIC_ONLY)
+        return hashlib.sha1(b"%d,%d:" % (self.width, self.height) + static).hexdigest()[:16]
@@ -0,0 +1,137 @@
+"""Planche de sprites du Pac-Man : toutes les images du jeu dessinées une fois dans un seul PNG."""
+import os
+from PIL import Image, ImageDraw
+
+# À incrémenter quand le dessin change, pour invalider les planches en cache
+ATLAS_VERSION = 1
+
+# Couleurs des éléments du jeu
+COLORS = {
+    "pacman": "#FFFF00",  # Jaune
+    "ghost1": "#FF0000",  # Rouge
+    "ghost2": "#00FFFF",  # Cyan
+    "ghost3": "#FFB8FF",  # Rose
+    "ghost4": "#FFB852",  # Orange
+    "ghost_vulnerable": "#0000FF",  # Bleu
+    "ghost_flash": "#FFFFFF",  # Clignotement de fin de mode puissance
+    "wall": "#0000FF",    # Bleu
+    "dot": "#FFFFFF",     # Blanc
+    "power": "#FFFFFF"    # Blanc
+}
+
+# Ouverture de la bouche de Pac-Man (demi-angle en degrés) pour chaque image,
+# et ordre des images pendant un déplacement d'une case
+MOUTH_ANGLES = (0, 15, 30, 45)
+MOUTH_CYCLE = (0, 1, 2, 3, 2, 1)
+
+# Orientation de la bouche (degrés, sens horaire depuis la droite comme dans PIL)
+DIRECTION_ANGLES = {"Right": 0, "Down": 90, "Left": 180, "Up": 270}
+
+GHOST_SPRITES = ("ghost1", "ghost2", "ghost3", "ghost4", "ghost_vulnerable", "ghost_flash")
+
+# Emplacements de la planche, de gauche à droite (une case de CELL_SIZE chacun)
+FRAMES = ([f"pacman_{direction}_{frame}" for direction in DIRECTION_ANGLES for frame in range(len(MOUTH_ANGLES))]
+          + list(GHOST_SPRITES) + ["wall", "dot", "power"])
+
+
+def draw_pacman(draw, x, size, direction, mouth):
+    # Disque jaune dont la bouche (transparente) s'ouvre de `mouth` degrés de part et d'autre
+    box = [x + 1, 1, x + size - 2, size - 2]
+    if mouth == 0:
+        draw.ellipse(box, fill=COLORS["pacman"])
+        return
+    angle = DIRECTION_ANGLES[direction]
+    draw.pieslice(box, angle + mouth, angle - mouth + 360, fill=COLORS["pacman"])
+
+
+def draw_ghost(draw, x, size, color, pupil="black"):
+    # Corps du fantôme (demi-cercle sur rectangle) dans une case de `size` pixels
+    inner = size - 2
+    left, top = x + 1, 1
+    draw.rectangle([left, top + inner//2, left + inner-1, top + inner-1], fill=color)
+    draw.ellipse([left, top, left + inner-1, top + inner], fill=color)
+
+    # Base ondulée (découpée en transparence)
+    wave_height = inner // 6
+    wave_width = inner // 3
+    for i in range(3):
+        x1 = left + i * wave_width
+        x2 = left + (i + 1) * wave_width
+        draw.ellipse([x1, top + inner - wave_height, x2, top + inner + wave_height], fill=(0, 0, 0, 0))
+
+    # Yeux
+    eye_size = inner // 5
+    for eye_x in (left + inner//4, left + inner*3//4):
+        eye_y = top + inner//3
+        draw.ellipse([eye_x - eye_size//2, eye_y - eye_size//2,
+                      eye_x + eye_size//2, eye_y + eye_size//2], fill="white")
+        draw.ellipse([eye_x - eye_size//4, eye_y - eye_size//4,
+                      eye_x + eye_size//4, eye_y + eye_size//4], fill=pupil)
+
+
+def draw_wall(draw, x, size):
+    # Dessiner le mur (rectangle bleu avec effet 3D)
+    draw.rectangle([x, 0, x + size-1, size-1], fill=COLORS["wall"])
+
+    # Bord supérieur et gauche plus clair, bord inférieur et droit plus foncé
+    lighter_blue = "#4444FF"
+    darker_blue = "#000088"
+    draw.line([(x, 0), (x + size-1, 0)], fill=lighter_blue, width=2)
+    draw.line([(x, 0), (x, size-1)], fill=lighter_blue, width=2)
+    draw.line([(x, size-1), (x + size-1, size-1)], fill=darker_blue, width=2)
+    draw.line([(x + size-1, 0), (x + size-1, size-1)], fill=darker_blue, width=2)
+
+
+def draw_pellet(draw, x, size, diameter, color):
+    offset = (size - diameter) // 2
+    draw.ellipse([x + offset, offset, x + offset + diameter, offset + diameter], fill=color)
+
+
+def render_atlas(size):
+    """Dessine toutes les images de FRAMES côte à côte, chacune dans une case de `size` pixels"""
+    sheet = Image.new("RGBA", (size * len(FRAMES), size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sheet)
+
+    for index, name in enumerate(FRAMES):
+        x = index * size
+        if name.startswith("pacman_"):
+            _, direction, frame = name.split("_")
+            draw_pacman(draw, x, size, direction, MOUTH_ANGLES[int(frame)])
+        elif name == "ghost_flash":
+            draw_ghost(draw, x, size, COLORS[name], pupil="#FF0000")
+        elif name in GHOST_SPRITES:
+            draw_ghost(draw, x, size, COLORS[name])
+        elif name == "wall":
+            draw_wall(draw, x, size)
+        elif name == "dot":
+            draw_pellet(draw, x, size, size // 5, COLORS["dot"])
+        elif name == "power":
+            draw_pellet(draw, x, size, size // 2, COLORS["power"])
+
+    return sheet
+
+
+def load_atlas(directory, size):
+    """Retourne la planche pour `size`, lue depuis `directory` ou dessinée puis enregistrée"""
+    path = os.path.join(directory, f"pacman_atlas_{size}_v{ATLAS_VERSION}.png")
+    if os.path.exists(path):
+        try:
+            sheet = Image.open(path)
+            sheet.load()
+            if sheet.size == (size * len(FRAMES), size):
+                return sheet
+        except OSError:
+            pass
+
+    sheet = render_atlas(size)
+    try:
+        sheet.save(path)
+    except OSError:
+        pass  # Dossier en lecture seule : la planche sera redessinée la prochaine fois
+    return sheet
+
+
+def slice_atlas(sheet, size):
+    """Découpe la planche en images PIL, par nom d'emplacement"""
+    return {name: sheet.crop((index * size, 0, (index + 1) * size, size))
+            for index, name in enumerate(FRAMES)}
@@ -0,0 +1,84 @@
+"""Simulation de parties de Pac-Man sans affichage, réparties sur plusieurs processus."""
+import argparse
+import json
+import multiprocessing
+import random
+import time
+from .rules import PacManState
+from .ai import POLICIES
+
+
+def play_game(job):
+    """Joue une partie complète et retourne son résultat"""
+    seed, policy_name, max_ticks, level_configs, use_numpy = job
+    state_class = PacManState
+    if use_numpy:
+        from .ghost_arrays import ArrayPacManState as state_class
+    state = state_class(seed=seed, level_configs=level_configs)
+    policy = POLICIES[policy_name]
+    policy_rng = random.Random(seed * 2 + 1)
+
+    start = time.perf_counter()
+    while not state.game_over and state.ticks < max_ticks:
+        state.change_direction(policy(state, policy_rng))
+        state.step()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "score": state.score,
+        "level": state.level,
+        "lives": state.lives,
+        "ticks": state.ticks,
+        "elapsed": elapsed,
+    }
+
+
+def run_batch(games, seed=0, policy="random", max_ticks=5000, processes=None, level_configs=None,
+              use_numpy=False):
+    """Joue `games` parties aux graines successives et retourne les résultats"""
+    jobs = [(seed + i, policy, max_ticks, level_configs, use_numpy) for i in range(games)]
+    if processes == 1:
+        return [play_game(job) for job in jobs]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(play_game, jobs, chunksize=max(1, games // (4 * (processes or multiprocessing.cpu_count()))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation de parties de Pac-Man sans affichage")
+    parser.add_argument("-n", "--games", type=int, default=100, help="nombre de parties")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random", help="stratégie de Pac-Man")
+    parser.add_argument("--max-ticks", type=int, default=5000, help="nombre maximal de ticks par partie")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="nombre de processus (défaut : tous les cœurs)")
+    parser.add_argument("--levels", help="fichier JSON remplaçant la configuration des niveaux")
+    parser.add_argument("--numpy", action="store_true",
+                        help="fantômes en tableaux NumPy (utile avec beaucoup de fantômes)")
+    args = parser.parse_args()
+    
+    if args.numpy:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            parser.error("--numpy nécessite NumPy (pip install numpy)")
+
+    level_configs = None
+    if args.levels:
+        with open(args.levels) as f:
+            level_configs = json.load(f)
+
+    start = time.perf_counter()
+    results = run_batch(args.games, args.seed, args.policy, args.max_ticks, args.processes, level_configs,
+                        args.numpy)
+    wall_time = time.perf_counter() - start
+
+    total_ticks = sum(result["ticks"] for result in results)
+    print(f"Parties : {len(results)} en {wall_time:.2f} s "
+          f"({len(results) / wall_time * 60:.0f} parties/min)")
+    print(f"Ticks : {total_ticks} ({total_ticks / wall_time:.0f} ticks/s)")
+    print(f"Score moyen : {sum(result['score'] for result in results) / len(results):.1f}, "
+          f"niveau max : {max(result['level'] for result in results)}")
+
+
+if __name__ == "__main__":
+    main()
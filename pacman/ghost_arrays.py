@@ -0,0 +1,148 @@
+"""Fantômes stockés en tableaux NumPy (une ligne par fantôme) et déplacés en une seule passe.
+
+Optionnel : seul ce module dépend de NumPy. ArrayPacManState se joue exactement
+comme PacManState (mêmes tirages aléatoires, mêmes positions) mais son coût par
+tick dépend peu du nombre de fantômes, ce qui sert aux simulations sans
+affichage et aux variantes à nombreux fantômes (clé "ghost_count").
+"""
+import numpy as np
+from .ai import DIRECTIONS, DIRECTION_BITS, OPPOSITE_DIRECTION
+from .rules import PacManState
+
+DIRECTION_NAMES = tuple(DIRECTIONS)
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(DIRECTION_NAMES)}
+
+# Bit de la direction opposée, par indice de direction
+REVERSE_BITS = np.array([DIRECTION_BITS[OPPOSITE_DIRECTION[direction]] for direction in DIRECTION_NAMES],
+                        dtype=np.uint8)
+
+# Pour chaque masque de navigation : indice de son unique direction, -1 s'il en a zéro ou plusieurs
+SINGLE_DIRECTION = np.array([
+    next((index for index, direction in enumerate(DIRECTION_NAMES) if DIRECTION_BITS[direction] == mask), -1)
+    for mask in range(16)
+], dtype=np.int8)
+
+
+class GhostArrays:
+    """Positions, cibles, directions et vulnérabilité de tous les fantômes"""
+
+    def __init__(self, ghosts):
+        count = len(ghosts)
+        self.pos = np.array([ghost["pos"] for ghost in ghosts], dtype=np.float64).reshape(count, 2)
+        self.target = np.array([ghost["target"] for ghost in ghosts], dtype=np.float64).reshape(count, 2)
+        self.direction = np.array([DIRECTION_INDEX[ghost["direction"]] for ghost in ghosts], dtype=np.int8)
+        self.vulnerable = np.array([ghost["vulnerable"] for ghost in ghosts], dtype=bool)
+        self.types = [ghost["type"] for ghost in ghosts]
+        # Vues ayant l'interface des dictionnaires, pour la vue Tk, les relectures...
+        self.views = [GhostView(self, index) for index in range(count)]
+
+
+class GhostView:
+    """Un fantôme de GhostArrays, accessible comme les dictionnaires de PacManState"""
+    __slots__ = ("arrays", "index")
+
+    def __init__(self, arrays, index):
+        self.arrays = arrays
+        self.index = index
+
+    def __getitem__(self, key):
+        arrays = self.arrays
+        if key == "pos":
+            return arrays.pos[self.index]
+        if key == "target":
+            row, col = arrays.target[self.index]
+            return [int(row), int(col)]
+        if key == "direction":
+            return DIRECTION_NAMES[arrays.direction[self.index]]
+        if key == "vulnerable":
+            return bool(arrays.vulnerable[self.index])
+        if key == "type":
+            return arrays.types[self.index]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        arrays = self.arrays
+        if key == "pos":
+            arrays.pos[self.index] = value
+        elif key == "target":
+            arrays.target[self.index] = value
+        elif key == "direction":
+            arrays.direction[self.index] = DIRECTION_INDEX[value]
+        elif key == "vulnerable":
+            arrays.vulnerable[self.index] = value
+        elif key == "type":
+            arrays.types[self.index] = value
+        elif key != "cell":
+            raise KeyError(key)
+
+
+class ArrayPacManState(PacManState):
+    """PacManState dont les fantômes sont déplacés et testés par lots"""
+
+    def create_ghosts(self, count):
+        self.ghost_arrays = GhostArrays(super().create_ghosts(count))
+        return self.ghost_arrays.views
+
+    def build_navigation(self):
+        super().build_navigation()
+        self.build_navigation_arrays()
+
+    def restore_navigation(self, data):
+        super().restore_navigation(data)
+        self.build_navigation_arrays()
+
+    def build_navigation_arrays(self):
+        # Masques et cases voisines (par indice de direction) en tableaux
+        self.nav_mask_array = np.frombuffer(bytes(self.nav_mask), dtype=np.uint8)
+        self.nav_targets = np.zeros((len(self.nav_neighbors), len(DIRECTION_NAMES), 2))
+        for index, neighbors in enumerate(self.nav_neighbors):
+            for direction, cell in neighbors.items():
+                self.nav_targets[index, DIRECTION_INDEX[direction]] = cell
+
+    def index_ghosts(self):
+        # Pas d'index par case : les distances à Pac-Man sont calculées d'un bloc
+        pass
+
+    def place_ghost(self, ghost):
+        pass
+
+    def move_ghosts(self):
+        """Déplace tous les fantômes d'un coup ; seuls ceux arrivés sur leur case décident"""
+        arrays = self.ghost_arrays
+        pos, target = arrays.pos, arrays.target
+        arrays.vulnerable[:] = self.power_mode
+
+        # Fantômes arrivés sur leur case cible : aligner sur la grille puis choisir la suite
+        arrived = np.flatnonzero((np.abs(pos - target) < 0.1).all(axis=1))
+        if arrived.size:
+            pos[arrived] = target[arrived]
+            
+            # Dans un couloir (une seule sortie hors demi-tour), la suite est imposée
+            cells = (target[arrived, 0] * self.GRID_WIDTH + target[arrived, 1]).astype(np.intp)
+            masks = self.nav_mask_array[cells]
+            forward = masks & ~REVERSE_BITS[arrays.direction[arrived]]
+            masks = np.where(forward != 0, forward, masks)
+            single = SINGLE_DIRECTION[masks]
+            corridor = single >= 0
+            directions = single[corridor]
+            arrays.direction[arrived[corridor]] = directions
+            target[arrived[corridor]] = self.nav_targets[cells[corridor], directions]
+            
+            # Aux intersections, chaque fantôme décide selon son comportement
+            # (dans l'ordre de la liste, pour consommer le générateur comme PacManState)
+            junctions = arrived[~corridor]
+            if junctions.size:
+                pacman_grid_pos, field = self.chase_target()
+                for index in junctions:
+                    self.steer_ghost(arrays.views[index], pacman_grid_pos, field)
+
+        # Mouvement fluide vers la cible, limité à GHOST_SPEED sur chaque axe
+        delta = target - pos
+        move = np.copysign(np.minimum(self.GHOST_SPEED, np.abs(delta)), delta)
+        move[np.abs(delta) <= 0.01] = 0.0
+        pos += move
+
+    def nearby_ghosts(self, row, col):
+        # Distance au carré de tous les fantômes à Pac-Man en une opération
+        distance = ((self.ghost_arrays.pos - self.pacman_pos) ** 2).sum(axis=1)
+        return [self.ghost_arrays.views[index] for index in np.flatnonzero(distance < 0.64)]
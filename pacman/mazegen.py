@@ -0,0 +1,163 @@
+"""Génération procédurale de labyrinthes de Pac-Man symétriques, avec cache sur disque."""
+import os
+import pickle
+import random
+import sys
+import time
+
+# Les données dérivées en cache (graphe de navigation, distances) sont
+# invalidées dès que l'algorithme de génération change
+GENERATOR_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mazes", "generated")
+
+# Dimensions et repères identiques au labyrinthe classique
+WIDTH, HEIGHT = 19, 21
+PACMAN_START = (15, 9)
+
+# Maison des fantômes (porte et case G) entourée d'un couloir sans points,
+# placée au centre : coin supérieur gauche en (HOUSE_TOP, HOUSE_LEFT)
+HOUSE = ["       ",
+         " ##-## ",
+         " # G # ",
+         " ##### ",
+         "       "]
+HOUSE_TOP, HOUSE_LEFT = 7, 6
+
+# Lignes des tunnels (la seconde est tirée au hasard parmi EXTRA_TUNNEL_ROWS)
+TUNNEL_ROW = 9
+EXTRA_TUNNEL_ROWS = (5, 13)
+
+# Super points de la moitié gauche (leurs symétriques sont ajoutés)
+POWER_CELLS = ((3, 1), (17, 1))
+
+# Proportion de murs supplémentaires ouverts entre deux nœuds pour créer des boucles
+LOOP_RATE = 0.25
+
+
+def in_house(row, col):
+    return HOUSE_TOP <= row < HOUSE_TOP + len(HOUSE) and HOUSE_LEFT <= col < HOUSE_LEFT + len(HOUSE[0])
+
+
+def generate_maze(seed):
+    """Retourne le texte (format du dossier mazes) d'un labyrinthe symétrique propre à `seed`"""
+    rng = random.Random(seed)
+    grid = [["#"] * WIDTH for _ in range(HEIGHT)]
+    mirror = WIDTH - 1
+
+    def set_cell(row, col, char):
+        # Toute modification est reportée sur la moitié droite
+        grid[row][col] = char
+        grid[row][mirror - col] = char
+
+    # Nœuds aux lignes et colonnes impaires de la moitié gauche (colonne centrale comprise)
+    nodes = {(row, col) for row in range(1, HEIGHT - 1, 2) for col in range(1, WIDTH // 2 + 1, 2)}
+    steps = ((-2, 0), (2, 0), (0, -2), (0, 2))
+
+    # Arbre couvrant aléatoire (parcours en profondeur) : tout est relié
+    visited = {PACMAN_START}
+    set_cell(*PACMAN_START, ".")
+    stack = [PACMAN_START]
+    while stack:
+        row, col = stack[-1]
+        choices = [(row + d_row, col + d_col) for d_row, d_col in steps
+                   if (row + d_row, col + d_col) in nodes and (row + d_row, col + d_col) not in visited]
+        if not choices:
+            stack.pop()
+            continue
+        next_r, next_c = rng.choice(choices)
+        set_cell((row + next_r) // 2, (col + next_c) // 2, ".")
+        set_cell(next_r, next_c, ".")
+        visited.add((next_r, next_c))
+        stack.append((next_r, next_c))
+
+    # Quelques boucles en plus, pour que les fantômes puissent être évités
+    for row, col in sorted(nodes):
+        for d_row, d_col in ((2, 0), (0, 2)):
+            if (row + d_row, col + d_col) in nodes and rng.random() < LOOP_RATE:
+                set_cell(row + d_row // 2, col + d_col // 2, ".")
+
+    # Maison des fantômes ; le couloir qui l'entoure reprend tous les passages
+    # qui traversaient la zone, la connexité est donc conservée
+    for i, line in enumerate(HOUSE):
+        for j, char in enumerate(line):
+            grid[HOUSE_TOP + i][HOUSE_LEFT + j] = char
+
+    # Supprimer les culs-de-sac en les prolongeant jusqu'au nœud suivant
+    changed = True
+    while changed:
+        changed = False
+        for row, col in sorted(nodes):
+            if in_house(row, col) or grid[row][col] == "#":
+                continue
+            exits = sum(grid[row + d_row // 2][col + d_col // 2] != "#" for d_row, d_col in steps)
+            if exits >= 2:
+                continue
+            options = [(row + d_row // 2, col + d_col // 2) for d_row, d_col in steps
+                       if 0 < row + d_row < HEIGHT - 1 and 0 < col + d_col < WIDTH - 1
+                       and grid[row + d_row // 2][col + d_col // 2] == "#"
+                       and not in_house(row + d_row // 2, col + d_col // 2)]
+            if options:
+                set_cell(*rng.choice(options), ".")
+                changed = True
+
+    # Tunnels vers le bord opposé
+    for row in (TUNNEL_ROW, rng.choice(EXTRA_TUNNEL_ROWS)):
+        set_cell(row, 0, " ")
+
+    for row, col in POWER_CELLS:
+        set_cell(row, col, "o")
+    grid[PACMAN_START[0]][PACMAN_START[1]] = "P"
+
+    # Garantie de connexité : murer toute case non atteignable depuis le départ
+    reached = {PACMAN_START}
+    frontier = [PACMAN_START]
+    while frontier:
+        row, col = frontier.pop()
+        for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            next_r, next_c = row + d_row, (col + d_col) % WIDTH
+            if 0 <= next_r < HEIGHT and grid[next_r][next_c] != "#" and (next_r, next_c) not in reached:
+                reached.add((next_r, next_c))
+                frontier.append((next_r, next_c))
+    for row in range(HEIGHT):
+        for col in range(WIDTH):
+            if grid[row][col] != "#" and (row, col) not in reached:
+                grid[row][col] = "#"
+
+    header = f"; Labyrinthe généré (graine {seed}, version {GENERATOR_VERSION})\n"
+    return header + "\n".join("".join(line) for line in grid) + "\n"
+
+
+def cache_path(seed):
+    return os.path.join(CACHE_DIR, f"{seed}_v{GENERATOR_VERSION}.pkl")
+
+
+def load_cached(seed):
+    """Retourne les données enregistrées pour `seed` par save_cached, ou None"""
+    try:
+        with open(cache_path(seed), "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def save_cached(seed, data):
+    """Enregistre les données d'un labyrinthe généré (texte et données dérivées)"""
+    path = cache_path(seed)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Remplacement atomique : plusieurs processus peuvent générer le même niveau
+        os.replace(temp_path, path)
+    except OSError:
+        pass  # Dossier en lecture seule : le labyrinthe sera recalculé la prochaine fois
+
+
+if __name__ == "__main__":
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    start = time.perf_counter()
+    text = generate_maze(seed)
+    elapsed = time.perf_counter() - start
+    print(text, end="")
+    print(f"; généré en {elapsed * 1000:.2f} ms")
@@ -0,0 +1,100 @@
+"""Mesure du temps passé dans chaque étape d'un tick de Pac-Man.
+
+Activé en définissant la variable d'environnement PACMAN_PROFILE avec le
+fichier de sortie : .json pour le format « trace event » de Chrome
+(chrome://tracing, Perfetto), sinon CSV. Sans cette variable, ce module n'est
+même pas importé et le jeu ne paie aucun surcoût.
+"""
+import atexit
+import collections
+import csv
+import json
+import time
+
+# Méthodes mesurées, sur l'état du jeu puis sur la vue Tk
+STATE_METHODS = ("move_pacman", "move_ghosts", "check_collisions")
+VIEW_METHODS = ("update", "draw_maze", "center_view_on_pacman")
+
+
+class TickProfiler:
+    """Chronomètre les étapes d'un tick et affiche leurs percentiles sur le canvas"""
+
+    def __init__(self, output_path=None, window=300, max_events=200000, hud_interval=500):
+        self.output_path = output_path
+        self.window = window
+        self.hud_interval = hud_interval
+        # Dernières durées (ms) par étape, pour les percentiles glissants
+        self.durations = collections.defaultdict(lambda: collections.deque(maxlen=window))
+        # Tous les événements (étape, début en ns, durée en ns), pour l'export
+        self.events = collections.deque(maxlen=max_events)
+        self.origin = time.perf_counter_ns()
+        self.game = None
+
+    def wrap(self, name, function):
+        durations = self.durations[name]
+        events = self.events
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                durations.append(elapsed / 1e6)
+                events.append((name, start, elapsed))
+
+        return timed
+
+    def install(self, game):
+        """Instrumente une instance de PacManGame (et son état) en place"""
+        self.game = game
+        for name in STATE_METHODS:
+            setattr(game.state, name, self.wrap(name, getattr(game.state, name)))
+        for name in VIEW_METHODS:
+            setattr(game, name, self.wrap(name, getattr(game, name)))
+
+        # La boucle de jeu garde ses propres références vers update et draw_maze
+        game.loop.update = game.update
+        game.loop.render = game.draw_maze
+
+        if self.output_path:
+            atexit.register(self.dump)
+        game.root.after(self.hud_interval, self.refresh_hud)
+
+    def percentiles(self, name):
+        values = sorted(self.durations[name])
+        if not values:
+            return None
+        last = len(values) - 1
+        return tuple(values[min(last, int(last * q + 0.5))] for q in (0.50, 0.95, 0.99))
+
+    def refresh_hud(self):
+        # Afficher les percentiles dans le coin supérieur gauche de la vue
+        canvas = self.game.canvas
+        lines = ["ms       p50    p95    p99"]
+        for name in VIEW_METHODS[:1] + STATE_METHODS + VIEW_METHODS[1:]:
+            stats = self.percentiles(name)
+            if stats:
+                lines.append(f"{name[:12]:<12} " + " ".join(f"{value:6.2f}" for value in stats))
+
+        canvas.delete("profiler")
+        canvas.create_text(canvas.canvasx(5), canvas.canvasy(5), text="\n".join(lines), anchor="nw",
+                           font=("Courier", 9), fill="#00FF00", tags="profiler")
+        self.game.root.after(self.hud_interval, self.refresh_hud)
+
+    def dump(self, path=None):
+        """Écrit les mesures au format CSV ou trace event de Chrome (.json)"""
+        path = path or self.output_path
+        if path.endswith(".json"):
+            trace = [{"name": name, "ph": "X", "pid": 1, "tid": 1,
+                      "ts": (start - self.origin) / 1000, "dur": elapsed / 1000}
+                     for name, start, elapsed in self.events]
+            with open(path, "w") as f:
+                json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["step", "start_ms", "duration_ms"])
+                for name, start, elapsed in self.events:
+                    writer.writerow([name, f"{(start - self.origin) / 1e6:.3f}", f"{elapsed / 1e6:.4f}"])
@@ -0,0 +1,575 @@
+import tkinter as tk
+from tkinter import messagebox
+import os
+import time
+from PIL import Image, ImageTk, ImageDraw
+from game_loop import FixedTimestepLoop
+from .rules import PacManState, EVENT_LEVEL_UP, EVENT_GAME_OVER
+from .assets import WALL, DOT, POWER, DOOR
+from .replay import Replay
+from .atlas import COLORS, MOUTH_ANGLES, MOUTH_CYCLE, DIRECTION_ANGLES, load_atlas, slice_atlas
+
+# Dossier racine des jeux, où se trouvent les dossiers sprites et replays
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Camera:
+    """Fait suivre Pac-Man par la vue du canvas en limitant les allers-retours avec Tk"""
+
+    def __init__(self, canvas, view_width, view_height, dead_zone):
+        self.canvas = canvas
+        # Taille visible du canvas, mise à jour seulement sur <Configure>
+        self.view_width = view_width
+        self.view_height = view_height
+        self.world_width = 0
+        self.world_height = 0
+        # Distance (en pixels) dont Pac-Man peut s'écarter du centre avant de défiler
+        self.dead_zone = dead_zone
+        self.center = None
+        self.fractions = (None, None)
+        
+        canvas.bind("<Configure>", self.on_configure)
+
+    def on_configure(self, event):
+        # Le canvas a changé de taille : recalculer le cadrage au prochain appel
+        if event.width > 1 and event.height > 1:
+            self.view_width = event.width
+            self.view_height = event.height
+            self.center = None
+
+    def set_world(self, width, height):
+        """Définit la taille (en pixels) de la zone à parcourir"""
+        self.world_width = width
+        self.world_height = height
+        self.center = None
+        self.fractions = (None, None)
+
+    def follow(self, x, y):
+        """Centre la vue sur (x, y) si le point est sorti de la zone morte"""
+        if self.center is not None:
+            if abs(x - self.center[0]) <= self.dead_zone and abs(y - self.center[1]) <= self.dead_zone:
+                return
+        self.center = (x, y)
+        
+        x_fraction = self.scroll_fraction(x, self.view_width, self.world_width)
+        y_fraction = self.scroll_fraction(y, self.view_height, self.world_height)
+        
+        # Ne défiler que si la position de la vue change réellement
+        if x_fraction != self.fractions[0]:
+            self.canvas.xview_moveto(x_fraction)
+        if y_fraction != self.fractions[1]:
+            self.canvas.yview_moveto(y_fraction)
+        self.fractions = (x_fraction, y_fraction)
+
+    @staticmethod
+    def scroll_fraction(position, view_size, world_size):
+        # Si le labyrinthe tient dans la fenêtre, aucun défilement n'est nécessaire
+        if world_size <= view_size:
+            return 0.0
+        fraction = (position - view_size / 2) / world_size
+        return max(0.0, min(1.0 - view_size / world_size, fraction))
+
+
+class PacManGame:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Pac-Man")
+        self.root.resizable(False, False)
+        
+        # Constantes d'affichage
+        self.WIDTH = 600
+        self.HEIGHT = 700
+        self.CELL_SIZE = 30
+        
+        # État du jeu, indépendant de Tk (la taille de la grille dépend du labyrinthe)
+        self.state = PacManState()
+        
+        # Enregistrement de la partie (graine et directions) pour pouvoir la rejouer
+        self.REPLAY_DIR = os.path.join(ROOT_DIR, "replays")
+        self.replay = Replay(self.state.seed)
+        
+        # Variables propres à l'interface
+        self.game_started = False
+        self.paused = False
+        self.LEVEL_TRANSITION = 2000  # Durée d'affichage du message de niveau (ms)
+        self.POWER_FLASH_TIME = 2000  # Les fantômes clignotent pendant la fin du mode puissance (ms)
+        
+        # Boucle à pas fixe : la logique avance tous les GAME_SPEED ms, l'affichage
+        # est rafraîchi à chaque image en interpolant les positions
+        self.loop = FixedTimestepLoop(root, self.update, self.draw_maze, self.state.GAME_SPEED)
+        self.previous_positions = None
+        
+        # Éléments du canvas conservés entre les ticks (rendu retenu)
+        self.items_maze = None  # Labyrinthe pour lequel les éléments ont été créés
+        self.cell_items = []
+        self.pacman_item = None
+        self.pacman_item_sprite = None  # (direction, image de la bouche) affichée
+        self.ghost_items = []
+        self.ghost_item_sprites = []
+        self.displayed_info = None
+        
+        # Cr��ation du cadre avec barres de défilement pour le canvas principal
+        self.canvas_frame = tk.Frame(root)
+        self.canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Barres de défilement
+        self.h_scrollbar = tk.Scrollbar(self.canvas_frame, orient=tk.HORIZONTAL)
+        self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        self.v_scrollbar = tk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL)
+        self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Création du canvas principal avec barres de défilement
+        self.canvas = tk.Canvas(self.canvas_frame, width=self.WIDTH, height=self.HEIGHT, bg="black",
+                              xscrollcommand=self.h_scrollbar.set, yscrollcommand=self.v_scrollbar.set)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Configuration des barres de défilement
+        self.h_scrollbar.config(command=self.canvas.xview)
+        self.v_scrollbar.config(command=self.canvas.yview)
+        
+        # Configuration de la région de défilement du canvas
+        self.canvas.config(scrollregion=(0, 0, self.WIDTH, self.HEIGHT))
+        
+        # Caméra qui suit Pac-Man
+        self.camera = Camera(self.canvas, self.WIDTH, self.HEIGHT, dead_zone=self.CELL_SIZE)
+        
+        # Panneau d'information
+        self.info_frame = tk.Frame(root, width=200, height=self.HEIGHT, bg="#2F2F2F")
+        self.info_frame.pack(side=tk.RIGHT, fill=tk.BOTH)
+        
+        # Création du cadre pour les contrôles
+        self.control_frame = tk.Frame(self.info_frame, bg="#2F2F2F")
+        self.control_frame.pack(pady=10)
+        
+        # Affichage du score et des vies
+        self.score_label = tk.Label(self.info_frame, text="Score: 0", font=("Arial", 14), bg="#2F2F2F", fg="white")
+        self.score_label.pack(pady=10)
+        
+        self.lives_label = tk.Label(self.info_frame, text="Vies: 3", font=("Arial", 14), bg="#2F2F2F", fg="white")
+        self.lives_label.pack(pady=10)
+        
+        self.level_label = tk.Label(self.info_frame, text="Niveau: 1", font=("Arial", 14), bg="#2F2F2F", fg="white")
+        self.level_label.pack(pady=10)
+        
+        # Boutons de contrôle
+        self.start_button = tk.Button(self.info_frame, text="Commencer", 
+                                    font=("Arial", 12), command=self.start_game)
+        self.start_button.pack(pady=10)
+        
+        self.restart_button = tk.Button(self.info_frame, text="Nouvelle Partie", 
+                                      font=("Arial", 12), command=self.reset_game)
+        self.restart_button.pack(pady=10)
+        self.restart_button.pack_forget()  # Cacher le bouton au démarrage
+        
+        # Chargement des sprites
+        self.load_sprites()
+        
+        # Liaison des touches du clavier
+        self.setup_bindings()
+        
+        # Mesure optionnelle des temps de chaque tick (PACMAN_PROFILE=fichier.csv|.json)
+        profile_path = os.environ.get("PACMAN_PROFILE")
+        if profile_path:
+            from .profiler import TickProfiler
+            TickProfiler(profile_path).install(self)
+        
+        # Afficher l'écran d'accueil
+        self.show_welcome_screen()
+    
+    def load_sprites(self):
+        # Créer un dossier pour les sprites s'il n'existe pas
+        sprites_dir = os.path.join(ROOT_DIR, "sprites")
+        if not os.path.exists(sprites_dir):
+            os.makedirs(sprites_dir)
+        self.sprites_dir = sprites_dir
+        
+        # Fonds de labyrinthe (murs pré-rendus) déjà chargés, par empreinte
+        self.wall_layers = {}
+        
+        # Couleurs des éléments du jeu
+        self.colors = COLORS
+        
+        # Découper les sprites dans la planche (dessinée une seule fois par taille de case)
+        frames = slice_atlas(load_atlas(sprites_dir, self.CELL_SIZE), self.CELL_SIZE)
+        self.sprites = {name: ImageTk.PhotoImage(image) for name, image in frames.items()
+                        if not name.startswith("pacman_")}
+        
+        # Pac-Man : une liste d'images (bouche fermée à grande ouverte) par direction
+        self.sprites["pacman"] = {
+            direction: [ImageTk.PhotoImage(frames[f"pacman_{direction}_{frame}"])
+                        for frame in range(len(MOUTH_ANGLES))]
+            for direction in DIRECTION_ANGLES
+        }
+        
+        # Garder l'image du mur pour composer le fond des labyrinthes
+        self.wall_image = frames["wall"]
+    
+    def show_welcome_screen(self):
+        # Afficher un écran d'accueil avec des instructions
+        self.canvas.delete("all")
+        self.items_maze = None
+        
+        # Titre du jeu
+        self.canvas.create_text(self.WIDTH // 2, self.HEIGHT // 4, 
+                              text="PAC-MAN", 
+                              font=("Arial", 36, "bold"), 
+                              fill="yellow")
+        
+        # Instructions
+        instructions = [
+            "Utilisez les flèches pour déplacer Pac-Man",
+            "Mangez tous les points pour passer au niveau suivant",
+            "Les super points rendent les fantômes vulnérables",
+            "Évitez les fantômes ou mangez-les quand ils sont bleus",
+            "P pour mettre en pause",
+            "\nCliquez sur 'Commencer' pour jouer"
+        ]
+        
+        y_pos = self.HEIGHT // 2
+        for line in instructions:
+            self.canvas.create_text(self.WIDTH // 2, y_pos, 
+                                  text=line, 
+                                  font=("Arial", 14), 
+                                  fill="white")
+            y_pos += 30
+        
+        # Dessiner quelques éléments décoratifs
+        # Pac-Man
+        self.canvas.create_image(self.WIDTH // 4, self.HEIGHT * 3 // 4, 
+                               image=self.sprites["pacman"][self.state.direction][-1], anchor="center")
+        
+        # Fantômes
+        ghost_types = ["ghost1", "ghost2", "ghost3", "ghost4"]
+        for i, ghost_type in enumerate(ghost_types):
+            self.canvas.create_image(self.WIDTH // 4 + (i + 1) * 50, self.HEIGHT * 3 // 4, 
+                                   image=self.sprites[ghost_type], anchor="center")
+    
+    def setup_bindings(self):
+        # Configurer les touches de contrôle
+        self.root.bind("<Left>", lambda event: self.change_direction("Left"))
+        self.root.bind("<Right>", lambda event: self.change_direction("Right"))
+        self.root.bind("<Up>", lambda event: self.change_direction("Up"))
+        self.root.bind("<Down>", lambda event: self.change_direction("Down"))
+        self.root.bind("p", self.toggle_pause)
+        self.root.bind("P", self.toggle_pause)
+    
+    def change_direction(self, new_direction):
+        # Changer la direction de Pac-Man
+        # Si le jeu est en pause, on mémorise seulement la prochaine direction souhaitée
+        if self.paused:
+            self.state.next_direction = new_direction
+            return
+        
+        if not self.state.game_over:
+            self.replay.record(self.state.ticks, new_direction)
+        self.state.change_direction(new_direction)
+        
+    def toggle_pause(self, event=None):
+        """Met en pause ou reprend le jeu"""
+        if not self.game_started or self.state.game_over:
+            return
+        
+        self.paused = not self.paused
+        
+        if self.paused:
+            # Afficher un message de pause
+            self.canvas.create_text(
+                self.WIDTH // 2, self.HEIGHT // 2,
+                text="PAUSE",
+                font=("Arial", 36, "bold"),
+                fill="yellow",
+                tags="pause"
+            )
+        else:
+            # Supprimer le message de pause et continuer le jeu
+            self.canvas.delete("pause")
+        
+        if self.paused:
+            self.loop.pause()
+        else:
+            self.loop.resume()  # Reprendre la boucle de jeu
+    
+    def start_game(self):
+        """Démarre le jeu"""
+        if not self.game_started:
+            self.game_started = True
+            self.start_button.pack_forget()  # Cacher le bouton de démarrage
+            self.start_loop()
+
+    def reset_game(self):
+        """Recommence une partie depuis le premier niveau"""
+        self.state.reset()
+        self.replay = Replay(self.state.seed)
+        self.paused = False
+        self.items_maze = None
+        self.restart_button.pack_forget()
+        self.game_started = True
+        self.start_button.pack_forget()
+        self.start_loop()
+
+    def start_loop(self):
+        # Démarrer la boucle de jeu au rythme du niveau courant
+        self.previous_positions = None
+        self.loop.step_ms = self.state.GAME_SPEED
+        self.draw_maze()
+        self.loop.start()
+
+    def update(self):
+        """Fait avancer les règles du jeu d'un pas de temps fixe"""
+        state = self.state
+        
+        # Mémoriser les positions actuelles pour l'interpolation de l'affichage
+        self.previous_positions = [tuple(state.pacman_pos)] + [tuple(ghost["pos"]) for ghost in state.ghosts]
+        
+        # Faire avancer les règles du jeu d'un tick
+        events = state.step()
+        
+        if EVENT_LEVEL_UP in events:
+            # Transition non bloquante : la boucle reprend après le message
+            self.previous_positions = None
+            self.loop.step_ms = state.GAME_SPEED
+            self.show_level_message()
+            self.loop.hold(self.LEVEL_TRANSITION)
+        elif EVENT_GAME_OVER in events:
+            self.loop.stop()
+            self.draw_maze()
+            self.save_replay()
+            self.show_game_over()
+
+    def interpolate(self, index, pos, alpha):
+        # Position affichée entre l'avant-dernier et le dernier tick
+        if self.previous_positions is None or index >= len(self.previous_positions):
+            return pos
+        previous = self.previous_positions[index]
+        # Pas d'interpolation lors d'un saut (tunnel, réapparition)
+        if abs(pos[0] - previous[0]) + abs(pos[1] - previous[1]) > 1.5:
+            return pos
+        return (previous[0] + (pos[0] - previous[0]) * alpha,
+                previous[1] + (pos[1] - previous[1]) * alpha)
+
+    def draw_maze(self, alpha=1.0):
+        # Mettre à jour l'affichage en mode retenu : les éléments fixes sont
+        # créés une seule fois par niveau, seuls les acteurs bougent à chaque image
+        state = self.state
+        if self.items_maze is not state.maze:
+            self.build_maze_items()
+        
+        # Supprimer uniquement les points mangés depuis le dernier tick
+        for i, j in state.eaten_cells:
+            item = self.cell_items[i][j]
+            if item is not None:
+                self.canvas.delete(item)
+                self.cell_items[i][j] = None
+        state.eaten_cells.clear()
+        
+        # Déplacer Pac-Man
+        row, col = self.interpolate(0, state.pacman_pos, alpha)
+        pacman_x = col * self.CELL_SIZE + self.CELL_SIZE//2
+        pacman_y = row * self.CELL_SIZE + self.CELL_SIZE//2
+        self.canvas.coords(self.pacman_item, pacman_x, pacman_y)
+        
+        # Animer la bouche : un cycle par case parcourue, figée quand Pac-Man est bloqué.
+        # Les images sont déjà découpées, seul l'élément du canvas change d'image
+        frame = self.pacman_item_sprite[1]
+        if self.previous_positions is not None and tuple(state.pacman_pos) != self.previous_positions[0]:
+            frame = MOUTH_CYCLE[min(int(alpha * len(MOUTH_CYCLE)), len(MOUTH_CYCLE) - 1)]
+        if self.pacman_item_sprite != (state.direction, frame):
+            self.canvas.itemconfig(self.pacman_item, image=self.sprites["pacman"][state.direction][frame])
+            self.pacman_item_sprite = (state.direction, frame)
+        
+        # Fin du mode puissance : fantômes alternativement bleus et blancs à chaque tick
+        vulnerable_key = "ghost_vulnerable"
+        if state.power_mode and state.power_mode_timer <= self.POWER_FLASH_TIME:
+            if (state.power_mode_timer // state.GAME_SPEED) % 2 == 0:
+                vulnerable_key = "ghost_flash"
+        
+        # Déplacer les fantômes
+        for index, ghost in enumerate(state.ghosts):
+            row, col = self.interpolate(index + 1, ghost["pos"], alpha)
+            x = col * self.CELL_SIZE + self.CELL_SIZE//2
+            y = row * self.CELL_SIZE + self.CELL_SIZE//2
+            self.canvas.coords(self.ghost_items[index], x, y)
+            
+            # Utiliser le sprite vulnérable si en mode puissance
+            if ghost["vulnerable"] and state.power_mode:
+                sprite_key = vulnerable_key
+            else:
+                sprite_key = ghost["type"]
+            if self.ghost_item_sprites[index] != sprite_key:
+                self.canvas.itemconfig(self.ghost_items[index], image=self.sprites[sprite_key])
+                self.ghost_item_sprites[index] = sprite_key
+        
+        # Centrer la vue sur Pac-Man pour le suivre
+        self.center_view_on_pacman(pacman_x, pacman_y)
+        
+        # Mettre à jour les informations affichées seulement si elles ont changé
+        self.update_info_labels()
+    
+    def build_maze_items(self):
+        # Créer les éléments du canvas pour le niveau courant et les indexer par case
+        self.canvas.delete("all")
+        
+        # Calculer la taille totale du labyrinthe
+        maze = self.state.maze
+        maze_width = maze.width * self.CELL_SIZE
+        maze_height = maze.height * self.CELL_SIZE
+        
+        # Mettre à jour la région de défilement du canvas
+        self.canvas.config(scrollregion=(0, 0, maze_width, maze_height))
+        self.camera.set_world(maze_width, maze_height)
+        
+        # Les murs et la porte forment une seule image de fond
+        self.canvas.create_image(0, 0, image=self.get_wall_layer(maze), anchor="nw")
+        
+        # Dessiner les points et super points
+        self.cell_items = [[None] * maze.width for _ in range(maze.height)]
+        for i in range(maze.height):
+            for j in range(maze.width):
+                x = j * self.CELL_SIZE
+                y = i * self.CELL_SIZE
+                
+                cell_type = maze.cells[i * maze.width + j]
+                if cell_type == DOT:  # Point
+                    item = self.canvas.create_image(x + self.CELL_SIZE//2, y + self.CELL_SIZE//2, 
+                                                    image=self.sprites["dot"])
+                elif cell_type == POWER:  # Super point
+                    item = self.canvas.create_image(x + self.CELL_SIZE//2, y + self.CELL_SIZE//2, 
+                                                    image=self.sprites["power"])
+                else:
+                    item = None
+                self.cell_items[i][j] = item
+        self.state.eaten_cells.clear()
+        
+        # Créer Pac-Man et les fantômes au-dessus du labyrinthe
+        self.pacman_item = self.canvas.create_image(0, 0, image=self.sprites["pacman"][self.state.direction][0])
+        self.pacman_item_sprite = (self.state.direction, 0)
+        
+        self.ghost_items = []
+        self.ghost_item_sprites = []
+        for ghost in self.state.ghosts:
+            self.ghost_items.append(self.canvas.create_image(0, 0, image=self.sprites[ghost["type"]]))
+            self.ghost_item_sprites.append(ghost["type"])
+        
+        self.items_maze = self.state.maze
+    
+    def get_wall_layer(self, maze):
+        """Retourne le fond (murs et porte) du labyrinthe, rendu une seule fois par disposition"""
+        key = f"{maze.static_key()}_{self.CELL_SIZE}"
+        layer = self.wall_layers.get(key)
+        if layer is not None:
+            return layer
+        
+        # Réutiliser l'image enregistrée lors d'une partie précédente
+        path = os.path.join(self.sprites_dir, f"pacman_walls_{key}.png")
+        image = None
+        if os.path.exists(path):
+            try:
+                image = Image.open(path)
+                image.load()
+            except OSError:
+                image = None
+        
+        if image is None:
+            image = self.render_wall_layer(maze)
+            try:
+                image.save(path)
+            except OSError:
+                pass  # Dossier en lecture seule : le fond sera recalculé la prochaine fois
+        
+        layer = ImageTk.PhotoImage(image)
+        self.wall_layers[key] = layer
+        return layer
+    
+    def render_wall_layer(self, maze):
+        # Composer les murs et la porte des fantômes dans une seule image
+        size = self.CELL_SIZE
+        image = Image.new("RGBA", (maze.width * size, maze.height * size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        
+        for i in range(maze.height):
+            for j in range(maze.width):
+                cell_type = maze.cells[i * maze.width + j]
+                x = j * size
+                y = i * size
+                if cell_type == WALL:  # Mur
+                    image.paste(self.wall_image, (x, y))
+                elif cell_type == DOOR:  # Porte fantôme
+                    draw.rectangle([x, y + size//2 - 2, x + size, y + size//2 + 2], 
+                                   fill="#FF69B4", outline="black")
+        
+        return image
+    
+    def update_info_labels(self):
+        # Ne reconfigurer les labels que lorsque leur valeur change
+        state = self.state
+        info = (state.score, state.lives, state.level)
+        if info == self.displayed_info:
+            return
+        self.score_label.config(text=f"Score: {state.score}")
+        self.lives_label.config(text=f"Vies: {state.lives}")
+        self.level_label.config(text=f"Niveau: {state.level}")
+        self.displayed_info = info
+        
+    def center_view_on_pacman(self, x, y):
+        # Centrer la vue du canvas sur Pac-Man (coordonnées du canvas)
+        self.camera.follow(x, y)
+    
+    def save_replay(self):
+        """Enregistre la partie terminée dans le dossier des relectures"""
+        self.replay.finish(self.state)
+        if not self.REPLAY_DIR:
+            return
+        try:
+            os.makedirs(self.REPLAY_DIR, exist_ok=True)
+            path = os.path.join(self.REPLAY_DIR, time.strftime("pacman_%Y%m%d_%H%M%S.pmr"))
+            self.replay.save(path)
+        except OSError as e:
+            print(f"Impossible d'enregistrer la relecture : {e}")
+    
+    def show_level_message(self):
+        # Afficher un message de niveau suivant
+        self.level_label.config(text=f"Niveau: {self.state.level}")
+        self.canvas.delete("all")
+        self.items_maze = None
+        self.canvas.create_text(self.WIDTH // 2, self.HEIGHT // 2, 
+                              text=f"Niveau {self.state.level}", 
+                              font=("Arial", 36, "bold"), 
+                              fill="yellow")
+    
+    def show_game_over(self):
+        """Affiche l'écran de fin de jeu"""
+        # Centrer le message sur la partie visible du canvas
+        x = self.canvas.canvasx(self.WIDTH // 2)
+        y = self.canvas.canvasy(self.HEIGHT // 2)
+        
+        self.canvas.create_rectangle(
+            x - self.WIDTH // 2 + 50, y - 60,
+            x + self.WIDTH // 2 - 50, y + 60,
+            fill="#000000", outline="#FFFFFF", width=2
+        )
+        
+        self.canvas.create_text(
+            x, y - 30,
+            text="GAME OVER",
+            font=("Arial", 24, "bold"),
+            fill="yellow"
+        )
+        
+        self.canvas.create_text(
+            x, y + 10,
+            text=f"Score final: {self.state.score}",
+            font=("Arial", 18),
+            fill="white"
+        )
+        
+        self.restart_button.pack(pady=10)
+        self.start_button.pack_forget()
+
+# Fonction principale pour démarrer le jeu
+def main():
+    root = tk.Tk()
+    game = PacManGame(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Enregistrement et relecture déterministe des parties de Pac-Man."""
+import argparse
+import hashlib
+import json
+import struct
+import sys
+import time
+from .rules import PacManState
+
+# Format binaire : en-tête, configuration des niveaux (JSON, optionnelle), puis
+# une entrée (tick, direction) de 5 octets par changement de direction
+MAGIC = b"PMRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQII16sII")  # magic, version, graine, ticks, score, empreinte, taille config, nb entrées
+INPUT = struct.Struct("<IB")  # tick, direction
+DIRECTION_CODES = ("Up", "Down", "Left", "Right")
+
+
+def state_hash(state):
+    """Empreinte de l'état de la partie, pour vérifier qu'une relecture est identique"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack("<IiiiI?i", state.ticks, state.score, state.lives, state.level,
+                              state.dots_collected, state.power_mode, state.power_mode_timer))
+    digest.update(bytes(state.maze.cells))
+    digest.update(struct.pack("<dd", *state.pacman_pos))
+    digest.update(state.direction.encode())
+    for ghost in state.ghosts:
+        digest.update(struct.pack("<dddd?", *ghost["pos"], *ghost["target"], ghost["vulnerable"]))
+        digest.update(ghost["direction"].encode())
+    digest.update(repr(state.rng.getstate()).encode())
+    return digest.digest()
+
+
+class Replay:
+    """Graine, configuration et changements de direction d'une partie"""
+
+    def __init__(self, seed, level_configs=None, inputs=None, ticks=0, score=0, final_hash=bytes(16)):
+        self.seed = seed
+        self.level_configs = level_configs
+        self.inputs = inputs if inputs is not None else []
+        self.ticks = ticks
+        self.score = score
+        self.final_hash = final_hash
+
+    def record(self, tick, direction):
+        """Mémorise un changement de direction appliqué avant le tick `tick`"""
+        self.inputs.append((tick, direction))
+
+    def finish(self, state):
+        """Fige le résultat attendu à partir de l'état final de la partie"""
+        self.ticks = state.ticks
+        self.score = state.score
+        self.final_hash = state_hash(state)
+
+    def to_bytes(self):
+        config = json.dumps(self.level_configs).encode() if self.level_configs is not None else b""
+        parts = [HEADER.pack(MAGIC, VERSION, self.seed, self.ticks, self.score, self.final_hash,
+                             len(config), len(self.inputs)), config]
+        parts.extend(INPUT.pack(tick, DIRECTION_CODES.index(direction)) for tick, direction in self.inputs)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, ticks, score, final_hash, config_size, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Fichier de relecture Pac-Man invalide ou d'une version inconnue")
+        offset = HEADER.size
+        level_configs = None
+        if config_size:
+            level_configs = json.loads(data[offset:offset + config_size])
+            offset += config_size
+        inputs = [(tick, DIRECTION_CODES[code])
+                  for tick, code in INPUT.iter_unpack(data[offset:offset + count * INPUT.size])]
+        return cls(seed, level_configs, inputs, ticks, score, final_hash)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def play(replay):
+    """Rejoue la partie sans affichage, aussi vite que possible, et retourne l'état final"""
+    state = PacManState(seed=replay.seed, level_configs=replay.level_configs)
+    inputs = replay.inputs
+    position = 0
+
+    while state.ticks < replay.ticks and not state.game_over:
+        while position < len(inputs) and inputs[position][0] <= state.ticks:
+            state.change_direction(inputs[position][1])
+            position += 1
+        state.step()
+
+    return state
+
+
+def verify(replay):
+    """Rejoue la partie et indique si le score et l'état final sont identiques"""
+    state = play(replay)
+    return state.score == replay.score and state_hash(state) == replay.final_hash, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relecture et vérification de parties de Pac-Man enregistrées")
+    parser.add_argument("replays", nargs="+", help="fichiers .pmr à rejouer")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.replays:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        ok, state = verify(replay)
+        elapsed = time.perf_counter() - start
+        status = "OK" if ok else "DIFFÉRENT"
+        print(f"{path} : {status} - {state.ticks} ticks en {elapsed:.3f} s "
+              f"({state.ticks / max(elapsed, 1e-9):.0f} ticks/s), score {state.score} (attendu {replay.score})")
+        failures += not ok
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""Règles du Pac-Man sans dépendance à Tk : état du jeu et pas de simulation."""
+import random
+from . import mazegen
+from .assets import Maze, MAZE_VARIANTS, DOT, POWER, BLOCKS_PACMAN
+from .ai import GhostAI, DIRECTIONS
+
+# Configuration des niveaux
+LEVEL_CONFIGS = [
+    # Niveau 1 - Facile
+    {
+        "ghost_speed": 0.4,
+        "game_speed": 200,
+        "power_duration": 10000
+    },
+    # Niveau 2 - Moyen
+    {
+        "ghost_speed": 0.5,
+        "game_speed": 180,
+        "power_duration": 8000,
+        "maze_variant": 1
+    },
+    # Niveau 3 - Difficile
+    {
+        "ghost_speed": 0.6,
+        "game_speed": 160,
+        "power_duration": 6000,
+        "maze_variant": 2
+    }
+]
+
+# Types de fantômes (comportements), attribués à tour de rôle ; "ghost_count"
+# dans LEVEL_CONFIGS permet d'en mettre plus de quatre
+GHOST_TYPES = ("ghost1", "ghost2", "ghost3", "ghost4")
+
+# Événements renvoyés par PacManState.step
+EVENT_LIFE_LOST = "life_lost"
+EVENT_LEVEL_UP = "level_up"
+EVENT_GAME_OVER = "game_over"
+
+
+class PacManState(GhostAI):
+    """État complet d'une partie de Pac-Man, avancé tick par tick par step()"""
+
+    def __init__(self, seed=None, level_configs=None):
+        # Constantes du jeu (la taille de la grille dépend du labyrinthe chargé)
+        self.PACMAN_SPEED = 1  # Vitesse de Pac-Man (cellules par mise à jour)
+        self.USE_DISTANCE_FIELD = True  # Poursuite par plus court chemin (sinon distance à vol d'oiseau)
+        
+        self.level_configs = level_configs if level_configs is not None else LEVEL_CONFIGS
+        
+        self.reset(seed)
+    
+    def reset(self, seed=None):
+        # Chaque partie a sa propre graine (tirée au hasard si non fournie),
+        # ce qui permet de la rejouer à l'identique
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        
+        # Initialiser les variables du jeu
+        self.score = 0
+        self.lives = 3
+        self.level = 1
+        self.ticks = 0
+        self.game_over = False
+        self.direction = "Right"  # Direction initiale de Pac-Man
+        self.next_direction = "Right"  # Prochaine direction souhaitée
+        self.dots_collected = 0
+        self.total_dots = 0
+        self.power_mode = False
+        self.power_mode_timer = 0
+        self.events = []
+        self.apply_level_config()
+        
+        # Définir la grille de jeu
+        self.create_maze()
+        
+        # Initialiser Pac-Man et les fantômes
+        self.init_characters()
+    
+    def level_config(self):
+        # Au-delà du dernier niveau configuré, on garde la dernière configuration
+        return self.level_configs[min(self.level, len(self.level_configs)) - 1]
+    
+    def apply_level_config(self):
+        config = self.level_config()
+        self.GHOST_SPEED = config["ghost_speed"]  # Vitesse des fantômes (cellules par mise à jour)
+        self.GAME_SPEED = config["game_speed"]  # Millisecondes entre chaque mise à jour
+        self.power_mode_duration = config["power_duration"]
+    
+    def create_maze(self):
+        # Créer le labyrinthe du jeu selon le niveau
+        cached = None
+        if self.level <= len(self.level_configs):
+            # Variante de labyrinthe spécifiée pour ce niveau
+            # (indice dans MAZE_VARIANTS ou nom d'un fichier du dossier mazes)
+            maze_variant = self.level_configs[self.level - 1].get("maze_variant", 0)
+            if isinstance(maze_variant, int):
+                maze_variant = MAZE_VARIANTS[maze_variant]
+            self.maze = Maze.load(maze_variant)
+        else:
+            # Au-delà des niveaux configurés : labyrinthe généré à partir du numéro
+            # de niveau, lu avec ses données dérivées depuis le cache disque si possible
+            cached = mazegen.load_cached(self.level)
+            text = cached["text"] if cached else mazegen.generate_maze(self.level)
+            self.maze = Maze.parse(text, f"generated_{self.level}")
+        
+        self.GRID_WIDTH = self.maze.width  # Nombre de cellules horizontales
+        self.GRID_HEIGHT = self.maze.height  # Nombre de cellules verticales
+        self.total_dots = self.maze.dots
+        
+        # Précalculer le graphe de navigation des fantômes et, pour les
+        # labyrinthes prédéfinis, toutes les distances (une seule fois par disposition)
+        if cached:
+            self.restore_navigation(cached)
+        else:
+            self.build_navigation()
+        if self.USE_DISTANCE_FIELD:
+            self.precompute_distance_fields()
+        if self.level > len(self.level_configs) and not cached:
+            mazegen.save_cached(self.level, self.navigation_data(text))
+        
+        # Cases dont le point a été mangé, à effacer par la vue
+        self.eaten_cells = []
+    
+    def init_characters(self):
+        # Initialiser Pac-Man
+        start_r, start_c = self.maze.pacman_start
+        self.pacman_pos = [float(start_r), float(start_c)]  # Utiliser des flottants pour un mouvement fluide
+        self.pacman_target = [start_r, start_c]  # Position cible (grille)
+        
+        # Initialiser les fantômes autour du centre de leur maison
+        self.ghosts = self.create_ghosts(self.level_config().get("ghost_count", 4))
+        self.GHOST_SPEED = self.level_config()["ghost_speed"]
+        self.index_ghosts()
+    
+    def create_ghosts(self, count):
+        """Crée `count` fantômes répartis sur les quatre cases de départ de la maison"""
+        home_r, home_c = self.maze.ghost_home
+        starts = [(home_r, home_c), (home_r, home_c - 1), (home_r, home_c + 1), (home_r - 1, home_c)]
+        ghosts = []
+        for i in range(count):
+            row, col = starts[i % 4]
+            ghosts.append({"pos": [float(row), float(col)], "target": [row, col], "type": GHOST_TYPES[i % 4],
+                           "direction": "Up", "vulnerable": False, "cell": None})
+        return ghosts
+    
+    def index_ghosts(self):
+        """Reconstruit l'index des fantômes par case de la grille"""
+        self.ghost_cells = {}
+        for ghost in self.ghosts:
+            ghost["cell"] = None
+            self.place_ghost(ghost)
+    
+    def place_ghost(self, ghost):
+        """Range le fantôme dans l'index sous la case la plus proche de sa position"""
+        cell = (int(round(ghost["pos"][0])), int(round(ghost["pos"][1])))
+        previous = ghost["cell"]
+        if cell == previous:
+            return
+        if previous is not None:
+            occupants = self.ghost_cells[previous]
+            occupants.remove(ghost)
+            if not occupants:
+                del self.ghost_cells[previous]
+        self.ghost_cells.setdefault(cell, []).append(ghost)
+        ghost["cell"] = cell
+    
+    def change_direction(self, new_direction):
+        # On stocke la prochaine direction souhaitée
+        self.next_direction = new_direction
+        
+        # Si le jeu est terminé, ne pas changer la direction immédiatement
+        if self.game_over:
+            return
+        
+        # Sinon, on change la direction immédiatement
+        self.direction = new_direction
+    
+    def step(self):
+        """Avance la partie d'un tick et retourne la liste des événements survenus"""
+        self.events = []
+        if self.game_over:
+            return self.events
+        self.ticks += 1
+        
+        # Mettre à jour le mode puissance
+        if self.power_mode:
+            self.power_mode_timer -= self.GAME_SPEED
+            if self.power_mode_timer <= 0:
+                self.power_mode = False
+                for ghost in self.ghosts:
+                    ghost["vulnerable"] = False
+        
+        # Déplacer Pac-Man
+        self.move_pacman()
+        
+        # Déplacer les fantômes
+        self.move_ghosts()
+        
+        # Vérifier les collisions
+        self.check_collisions()
+        
+        return self.events
+    
+    def move_pacman(self):
+        # Logique de déplacement de Pac-Man
+        if self.game_over:
+            return
+        
+        # Calculer la nouvelle position (ligne, colonne)
+        d_row, d_col = DIRECTIONS[self.direction]
+        new_r = self.pacman_pos[0] + d_row * self.PACMAN_SPEED
+        new_c = self.pacman_pos[1] + d_col * self.PACMAN_SPEED
+        
+        # Gérer la téléportation aux bords
+        if new_c < 0:
+            new_c = self.GRID_WIDTH - 1
+        elif new_c >= self.GRID_WIDTH:
+            new_c = 0
+        
+        # Vérifier les collisions avec les murs et la porte des fantômes
+        grid_r, grid_c = int(round(new_r)), int(round(new_c))
+        if 0 <= grid_r < self.GRID_HEIGHT and 0 <= grid_c < self.GRID_WIDTH:
+            if not BLOCKS_PACMAN[self.maze.cells[grid_r * self.GRID_WIDTH + grid_c]]:
+                self.pacman_pos = [new_r, new_c]
+
+    def check_collisions(self):
+        """Vérifie les collisions entre Pac-Man, les points et les fantômes"""
+        # Conversion de la position de Pac-Man en indices de grille
+        pac_x, pac_y = int(round(self.pacman_pos[0])), int(round(self.pacman_pos[1]))
+        
+        # Sécurité pour éviter les erreurs d'index
+        if 0 <= pac_x < self.GRID_HEIGHT and 0 <= pac_y < self.GRID_WIDTH:
+            index = pac_x * self.GRID_WIDTH + pac_y
+            cell = self.maze.cells[index]
+            if cell == DOT:  # Pièce normale
+                self.maze.eat(index)
+                self.eaten_cells.append((pac_x, pac_y))
+                self.score += 10
+                self.dots_collected += 1
+            elif cell == POWER:  # Super point (inverseur)
+                self.maze.eat(index)
+                self.eaten_cells.append((pac_x, pac_y))
+                self.score += 50
+                self.dots_collected += 1
+                self.activate_power_mode()
+
+        # Collision avec les fantômes proches
+        pac_r, pac_c = self.pacman_pos
+        for ghost in self.nearby_ghosts(pac_x, pac_y):
+            # Distance au carré comparée au carré du seuil de collision (0.8)
+            distance = (pac_r - ghost["pos"][0])**2 + (pac_c - ghost["pos"][1])**2
+            
+            if distance < 0.64:
+                if ghost["vulnerable"] and self.power_mode:
+                    # Manger un fantôme vulnérable
+                    self.score += 200
+                    # Renvoyer le fantôme dans sa maison
+                    home_r, home_c = self.maze.ghost_home
+                    ghost["pos"] = [float(home_r), float(home_c)]
+                    ghost["target"] = [home_r, home_c]
+                    ghost["vulnerable"] = False  # N'est plus vulnérable après avoir été mangé
+                    self.place_ghost(ghost)
+                elif not self.power_mode:  # Pac-Man perd une vie seulement si pas en mode puissance
+                    self.lose_life()
+                    return  # Sortir après avoir perdu une vie pour éviter multi-collisions
+        
+        # Vérifier si tous les points sont collectés
+        if self.maze.dots <= 0:
+            self.next_level()
+    
+    def nearby_ghosts(self, row, col):
+        """Fantômes pouvant toucher Pac-Man, situé sur la case (row, col)"""
+        # Le seuil de collision (0.8) étant inférieur à une case, seuls les
+        # fantômes des cases voisines de celle de Pac-Man peuvent le toucher
+        nearby = []
+        for r in (row - 1, row, row + 1):
+            for c in (col - 1, col, col + 1):
+                occupants = self.ghost_cells.get((r, c))
+                if occupants:
+                    nearby.extend(occupants)
+        return nearby
+    
+    def activate_power_mode(self):
+        """Active le mode puissance (fantômes vulnérables)"""
+        self.power_mode = True
+        self.power_mode_timer = self.level_config()["power_duration"]
+        for ghost in self.ghosts:
+            ghost["vulnerable"] = True
+    
+    def lose_life(self):
+        """Gère la perte d'une vie"""
+        self.lives -= 1
+        if self.lives <= 0:
+            self.game_over = True
+            self.events.append(EVENT_GAME_OVER)
+        else:
+            self.init_characters()
+            self.events.append(EVENT_LIFE_LOST)
+    
+    def next_level(self):
+        # Passer au niveau suivant
+        self.level += 1
+        
+        # Réinitialiser le jeu pour le nouveau niveau
+        self.dots_collected = 0
+        self.power_mode = False
+        
+        # Mettre à jour la vitesse des fantômes et la durée du mode puissance
+        self.apply_level_config()
+        
+        # Créer un nouveau labyrinthe
+        self.create_maze()
+        
+        # Réinitialiser les positions
+        start_r, start_c = self.maze.pacman_start
+        self.pacman_pos = [float(start_r), float(start_c)]
+        self.pacman_target = [start_r, start_c]
+        home_r, home_c = self.maze.ghost_home
+        ghost_count = self.level_config().get("ghost_count", 4)
+        if ghost_count != len(self.ghosts):
+            self.ghosts = self.create_ghosts(ghost_count)
+        for ghost in self.ghosts:
+            ghost["pos"] = [float(home_r), float(home_c)]
+            ghost["target"] = [home_r, home_c]
+            ghost["vulnerable"] = False
+        self.index_ghosts()
+        
+        self.events.append(EVENT_LEVEL_UP)
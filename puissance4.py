@@ -4,6 +4,7 @@ import random
 import os
 import time
 from PIL import Image, ImageTk, ImageDraw
+from puissance4_engine import Position
 
 class AI_Player:
     def __init__(self, game, player_number=2):
@@ -11,16 +12,16 @@ class AI_Player:
         self.player_number = player_number  # Par défaut, l'IA est le joueur 2
         self.opponent = 3 - player_number  # L'adversaire est l'autre joueur
     
-    def get_best_move(self):
-        # Évaluer chaque colonne possible
+    def get_best_move(self, position=None):
+        # Évaluer chaque colonne possible sur la position en bitboards (celle du jeu par défaut) :
+        # chaque coup est joué puis annulé en O(1), sans toucher à la grille affichée
+        if position is None:
+            position = self.game.position
         best_score = -float('inf')
         best_col = 0
-        valid_moves = []
         
         # Trouver toutes les colonnes valides
-        for col in range(self.game.COLS):
-            if self.game.board[0][col] == 0:  # Si la colonne n'est pas pleine
-                valid_moves.append(col)
+        valid_moves = position.valid_moves()
         
         # Si aucun coup valide, retourner None
         if not valid_moves:
@@ -28,19 +29,10 @@ class AI_Player:
         
         # Évaluer chaque coup possible
         for col in valid_moves:
-            # Trouver la position où le jeton va tomber
-            row = self.game.ROWS - 1
-            while row >= 0 and self.game.board[row][col] != 0:
-                row -= 1
-            
-            # Simuler le coup
-            self.game.board[row][col] = self.player_number
-            
-            # Évaluer le plateau après ce coup
-            score = self.evaluate_board(row, col)
-            
-            # Annuler le coup
-            self.game.board[row][col] = 0
+            # Simuler le coup, évaluer le plateau puis annuler le coup
+            position.play(col, self.player_number)
+            score = self.evaluate_board(position, col)
+            position.undo(col)
             
             # Mettre à jour le meilleur coup si nécessaire
             if score > best_score:
@@ -49,70 +41,37 @@ class AI_Player:
         
         return best_col
     
-    def evaluate_board(self, last_row, last_col):
+    def evaluate_board(self, position, last_col):
         score = 0
-        player = self.player_number
-        opponent = self.opponent
         
         # Vérifier si ce coup est gagnant
-        if self.game.check_winner(last_row, last_col):
+        if position.has_won(self.player_number):
             return 1000  # Score très élevé pour un coup gagnant
         
         # Vérifier si l'adversaire peut gagner au prochain tour
-        for col in range(self.game.COLS):
-            if self.game.board[0][col] != 0:  # Colonne pleine
-                continue
-                
-            # Trouver où le jeton va tomber
-            row = self.game.ROWS - 1
-            while row >= 0 and self.game.board[row][col] != 0:
-                row -= 1
-                
-            # Simuler le coup de l'adversaire
-            self.game.board[row][col] = opponent
-            
-            # Si l'adversaire peut gagner, bloquer cette colonne
-            if self.game.check_winner(row, col):
+        for col in position.valid_moves():
+            if position.is_winning_move(col, self.opponent):
                 score -= 500  # Score négatif élevé
-                
-            # Annuler le coup
-            self.game.board[row][col] = 0
         
         # Favoriser le centre
-        center_col = self.game.COLS // 2
+        center_col = position.cols // 2
         if last_col == center_col:
             score += 3
         
-        # Favoriser les positions qui permettent de créer des alignements
-        # Horizontalement
-        for c in range(max(0, last_col-3), min(self.game.COLS-3, last_col+1)):
-            window = [self.game.board[last_row][c+i] for i in range(4)]
-            score += self.evaluate_window(window)
-        
-        # Verticalement
-        for r in range(max(0, last_row-3), min(self.game.ROWS-3, last_row+1)):
-            window = [self.game.board[r+i][last_col] for i in range(4)]
-            score += self.evaluate_window(window)
-        
-        # Diagonale (haut-gauche à bas-droite)
-        for i in range(-3, 1):
-            if 0 <= last_row+i < self.game.ROWS-3 and 0 <= last_col+i < self.game.COLS-3:
-                window = [self.game.board[last_row+i+j][last_col+i+j] for j in range(4)]
-                score += self.evaluate_window(window)
-        
-        # Diagonale (bas-gauche à haut-droite)
-        for i in range(-3, 1):
-            if 3 <= last_row+i < self.game.ROWS and 0 <= last_col+i < self.game.COLS-3:
-                window = [self.game.board[last_row+i-j][last_col+i+j] for j in range(4)]
-                score += self.evaluate_window(window)
+        # Favoriser les positions qui permettent de créer des alignements : fenêtres de
+        # quatre cases passant par le jeton joué (horizontales, verticales, diagonales)
+        mine = position.masks[self.player_number - 1]
+        theirs = position.masks[self.opponent - 1]
+        for window in position.windows[position.top_index(last_col)]:
+            score += self.evaluate_window(window, mine, theirs)
         
         return score
     
-    def evaluate_window(self, window):
+    def evaluate_window(self, window, mine, theirs):
         score = 0
-        player_count = window.count(self.player_number)
-        empty_count = window.count(0)
-        opponent_count = window.count(self.opponent)
+        player_count = bin(window & mine).count("1")
+        opponent_count = bin(window & theirs).count("1")
+        empty_count = 4 - player_count - opponent_count
         
         # Évaluer la fenêtre
         if player_count == 3 and empty_count == 1:
@@ -142,6 +101,7 @@ class Puissance4Game:
         
         # Variables du jeu
         self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.position = Position(self.ROWS, self.COLS)  # Même grille en bitboards (règles et IA)
         self.current_player = 1  # Joueur 1 commence
         self.game_over = False
         self.game_started = False
@@ -311,6 +271,7 @@ class Puissance4Game:
     def reset_game(self):
         # Réinitialiser les variables du jeu
         self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.position = Position(self.ROWS, self.COLS)  # Même grille en bitboards (règles et IA)
         self.current_player = 1
         self.game_over = False
         self.falling_piece = None
@@ -409,6 +370,7 @@ class Puissance4Game:
         else:
             # Placer le jeton sur le plateau
             self.board[target_row][col] = player
+            self.position.play(col, player)
             self.falling_piece = None
             self.draw_board()
             
@@ -437,74 +399,12 @@ class Puissance4Game:
         self.player2_label.config(text=f"Joueur 2: {self.scores[2]}")
     
     def check_winner(self, row, col):
-        # Vérifier s'il y a un gagnant
-        player = self.board[row][col]
-        
-        # Vérifier horizontalement
-        count = 0
-        for c in range(self.COLS):
-            if self.board[row][c] == player:
-                count += 1
-                if count >= 4:
-                    return True
-            else:
-                count = 0
-        
-        # Vérifier verticalement
-        count = 0
-        for r in range(self.ROWS):
-            if self.board[r][col] == player:
-                count += 1
-                if count >= 4:
-                    return True
-            else:
-                count = 0
-        
-        # Vérifier diagonale (haut-gauche à bas-droite)
-        # Trouver le point de départ de la diagonale
-        start_row, start_col = row, col
-        while start_row > 0 and start_col > 0:
-            start_row -= 1
-            start_col -= 1
-        
-        # Parcourir la diagonale
-        count = 0
-        r, c = start_row, start_col
-        while r < self.ROWS and c < self.COLS:
-            if self.board[r][c] == player:
-                count += 1
-                if count >= 4:
-                    return True
-            else:
-                count = 0
-            r += 1
-            c += 1
-        
-        # Vérifier diagonale (bas-gauche à haut-droite)
-        # Trouver le point de départ de la diagonale
-        start_row, start_col = row, col
-        while start_row < self.ROWS - 1 and start_col > 0:
-            start_row += 1
-            start_col -= 1
-        
-        # Parcourir la diagonale
-        count = 0
-        r, c = start_row, start_col
-        while r >= 0 and c < self.COLS:
-            if self.board[r][c] == player:
-                count += 1
-                if count >= 4:
-                    return True
-            else:
-                count = 0
-            r -= 1
-            c += 1
-        
-        return False
+        # Vérifier si le jeton de cette case fait partie d'un alignement de quatre
+        return self.position.has_won(self.board[row][col])
     
     def is_board_full(self):
         # Vérifier si le plateau est plein
-        return all(self.board[0][col] != 0 for col in range(self.COLS))
+        return self.position.is_full()
     
     def ai_make_move(self):
         # L'IA joue son coup
@@ -0,0 +1,123 @@
+"""Position de Puissance 4 sans Tk : un masque de bits par joueur, coups joués et annulés en O(1).
+
+Chaque colonne occupe ROWS + 1 bits consécutifs, du bas vers le haut (bit
+colonne * (ROWS + 1) + hauteur). Le bit du dessus reste toujours vide : un
+décalage ne fait jamais passer un alignement d'une colonne à la suivante, et
+quatre jetons alignés se détectent avec quelques décalages et ET logiques.
+"""
+
+ROWS = 6
+COLS = 7
+
+
+def connected_four(mask, stride):
+    """Indique si `mask` contient quatre jetons alignés (vertical, horizontal ou en diagonale)"""
+    # Décalages d'une case : vers le haut, la colonne voisine et les deux diagonales
+    for shift in (1, stride, stride - 1, stride + 1):
+        pairs = mask & (mask >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+_WINDOWS_CACHE = {}
+
+
+def build_windows(rows, cols):
+    """Masques des fenêtres de quatre cases alignées passant par chaque case : [indice du bit] -> (masque, ...)"""
+    windows = _WINDOWS_CACHE.get((rows, cols))
+    if windows is not None:
+        return windows
+    stride = rows + 1
+    windows = [[] for _ in range(stride * cols)]
+    # (colonnes, hauteurs) parcourues par une fenêtre : horizontale, verticale,
+    # diagonale descendante (vers le bas à droite) puis montante
+    for dc, dh in ((1, 0), (0, 1), (1, -1), (1, 1)):
+        for col in range(cols):
+            for height in range(rows):
+                cells = [(col + i * dc, height + i * dh) for i in range(4)]
+                if not all(0 <= c < cols and 0 <= h < rows for c, h in cells):
+                    continue
+                mask = 0
+                for c, h in cells:
+                    mask |= 1 << (c * stride + h)
+                for c, h in cells:
+                    windows[c * stride + h].append(mask)
+    windows = _WINDOWS_CACHE[(rows, cols)] = [tuple(masks) for masks in windows]
+    return windows
+
+
+class Position:
+    """Jetons des deux joueurs (joueur 1 et 2) et hauteur de chaque colonne"""
+
+    def __init__(self, rows=ROWS, cols=COLS):
+        self.rows = rows
+        self.cols = cols
+        self.stride = rows + 1  # Bits par colonne, dont un toujours vide au-dessus
+        self.windows = build_windows(rows, cols)
+        self.masks = [0, 0]  # Jetons du joueur 1, puis du joueur 2
+        self.heights = [0] * cols  # Nombre de jetons dans chaque colonne
+        self.moves = 0
+
+    @classmethod
+    def from_board(cls, board):
+        """Position d'une grille de Puissance4Game (ligne 0 en haut, 0 = vide, 1 ou 2 = joueur)"""
+        position = cls(len(board), len(board[0]))
+        for row in reversed(range(position.rows)):
+            for col, player in enumerate(board[row]):
+                if player:
+                    position.play(col, player)
+        return position
+
+    def bit(self, col):
+        """Bit de la case où tomberait un jeton joué dans la colonne `col`"""
+        return 1 << (col * self.stride + self.heights[col])
+
+    def top_index(self, col):
+        """Indice du bit du dernier jeton de la colonne `col` (pour Position.windows)"""
+        return col * self.stride + self.heights[col] - 1
+
+    def row(self, col):
+        """Ligne (0 en haut, comme Puissance4Game.board) où tomberait un jeton dans la colonne"""
+        return self.rows - 1 - self.heights[col]
+
+    def can_play(self, col):
+        return self.heights[col] < self.rows
+
+    def valid_moves(self):
+        return [col for col in range(self.cols) if self.heights[col] < self.rows]
+
+    def is_full(self):
+        return self.moves == self.rows * self.cols
+
+    def play(self, col, player):
+        """Fait tomber un jeton du joueur (1 ou 2) dans la colonne, qui ne doit pas être pleine"""
+        self.masks[player - 1] |= self.bit(col)
+        self.heights[col] += 1
+        self.moves += 1
+
+    def undo(self, col):
+        """Retire le dernier jeton de la colonne (annule play)"""
+        self.heights[col] -= 1
+        self.moves -= 1
+        bit = self.bit(col)
+        if self.masks[0] & bit:
+            self.masks[0] ^= bit
+        else:
+            self.masks[1] ^= bit
+
+    def has_won(self, player):
+        return connected_four(self.masks[player - 1], self.stride)
+
+    def is_winning_move(self, col, player):
+        """Indique si jouer dans la colonne ferait gagner le joueur, sans modifier la position"""
+        return connected_four(self.masks[player - 1] | self.bit(col), self.stride)
+
+    def cell(self, row, col):
+        """Joueur dont le jeton occupe la case (ligne 0 en haut), 0 si elle est vide"""
+        bit = 1 << (col * self.stride + self.rows - 1 - row)
+        if self.masks[0] & bit:
+            return 1
+        if self.masks[1] & bit:
+            return 2
+        return 0
@@ -1,11 +1,211 @@
 import tkinter as tk
 from tkinter import messagebox
+import argparse
 import random
 import os
 from PIL import Image, ImageTk, ImageDraw
+from tetris_engine import GARBAGE, GENERATORS, TetrisEngine, PIECES
+from tetris_ai import TetrisAI
+from game_loop import FixedTimestepLoop
+
+# Couleurs des pièces de Tetris
+PIECE_COLORS = {
+    "I": "#00FFFF",  # Cyan
+    "J": "#0000FF",  # Bleu
+    "L": "#FF7F00",  # Orange
+    "O": "#FFFF00",  # Jaune
+    "S": "#00FF00",  # Vert
+    "T": "#800080",  # Violet
+    "Z": "#FF0000"   # Rouge
+}
+GARBAGE_COLOR = "#808080"  # Lignes de pénalité (mode versus)
+
+
+def lighten_color(color_hex):
+    # Convertir la couleur hex en RGB et la rendre plus claire
+    r = int(color_hex[1:3], 16)
+    g = int(color_hex[3:5], 16)
+    b = int(color_hex[5:7], 16)
+    
+    # Éclaircir
+    r = min(255, r + 50)
+    g = min(255, g + 50)
+    b = min(255, b + 50)
+    
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def darken_color(color_hex):
+    # Convertir la couleur hex en RGB et la rendre plus foncée
+    r = int(color_hex[1:3], 16)
+    g = int(color_hex[3:5], 16)
+    b = int(color_hex[5:7], 16)
+    
+    # Assombrir
+    r = max(0, r - 50)
+    g = max(0, g - 50)
+    b = max(0, b - 50)
+    
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def create_block_sprite(color, cell_size):
+    # Créer un sprite pour un bloc
+    block_size = cell_size - 2  # Légèrement plus petit pour voir la grille
+    img = Image.new("RGBA", (block_size, block_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    
+    # Dessiner le bloc avec un effet 3D
+    draw.rectangle([0, 0, block_size-1, block_size-1], fill=color)
+    
+    # Bord supérieur et gauche plus clair (effet de lumière)
+    lighter_color = lighten_color(color)
+    draw.line([(0, 0), (block_size-1, 0)], fill=lighter_color, width=2)  # Haut
+    draw.line([(0, 0), (0, block_size-1)], fill=lighter_color, width=2)  # Gauche
+    
+    # Bord inférieur et droit plus foncé (effet d'ombre)
+    darker_color = darken_color(color)
+    draw.line([(0, block_size-1), (block_size-1, block_size-1)], fill=darker_color, width=2)  # Bas
+    draw.line([(block_size-1, 0), (block_size-1, block_size-1)], fill=darker_color, width=2)  # Droite
+    
+    return ImageTk.PhotoImage(img)
+
+
+def create_ghost_sprite(color, cell_size):
+    # Bloc de la pièce fantôme : contour de la couleur de la pièce, intérieur translucide
+    block_size = cell_size - 2
+    r = int(color[1:3], 16)
+    g = int(color[3:5], 16)
+    b = int(color[5:7], 16)
+    img = Image.new("RGBA", (block_size, block_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, block_size-1, block_size-1], fill=(r, g, b, 50), outline=(r, g, b, 255), width=2)
+    return ImageTk.PhotoImage(img)
+
+
+def load_block_sprites(cell_size):
+    """Sprites des blocs (pièces et lignes de pénalité) et des pièces fantômes"""
+    block_sprites = {GARBAGE: create_block_sprite(GARBAGE_COLOR, cell_size)}
+    ghost_sprites = {}
+    for piece_type, color in PIECE_COLORS.items():
+        block_sprites[piece_type] = create_block_sprite(color, cell_size)
+        ghost_sprites[piece_type] = create_ghost_sprite(color, cell_size)
+    return block_sprites, ghost_sprites
+
+
+class BoardView:
+    """Affichage d'un moteur sur un canvas : grille, blocs verrouillés, pièce actuelle et fantôme.
+
+    Les images sont créées une fois par partie (draw_board) puis seulement
+    déplacées ou mises à jour case par case.
+    """
+    
+    def __init__(self, canvas, engine, grid_size, block_sprites, ghost_sprites, show_ghost=True):
+        self.canvas = canvas
+        self.engine = engine
+        self.grid_size = grid_size
+        self.block_sprites = block_sprites
+        self.ghost_sprites = ghost_sprites
+        self.show_ghost = show_ghost
+        self.block_items = {}
+        self.ghost_items = []
+        self.piece_items = []
+        self.piece_item_type = None
+    
+    def draw_board(self):
+        # Redessiner tout le plateau (nouvelle partie) : lignes de la grille,
+        # blocs verrouillés et images de la pièce actuelle
+        self.canvas.delete("all")
+        
+        # Les lignes de la grille sont dessinées une fois et ne bougent plus
+        for x in range(0, self.engine.width * self.grid_size, self.grid_size):
+            self.canvas.create_line(x, 0, x, self.engine.height * self.grid_size, fill="#333333")
+        
+        for y in range(0, self.engine.height * self.grid_size, self.grid_size):
+            self.canvas.create_line(0, y, self.engine.width * self.grid_size, y, fill="#333333")
+        
+        # Index case -> (type affiché, item) des blocs verrouillés
+        self.block_items = {}
+        self.draw_grid()
+        
+        # La pièce fantôme et la pièce actuelle réutilisent les mêmes images,
+        # déplacées avec coords() (la pièce au-dessus de son fantôme)
+        self.ghost_items = [
+            self.canvas.create_image(0, 0, anchor="nw", state="hidden", tags="ghost")
+            for _ in self.engine.shape().blocks
+        ]
+        self.piece_items = [
+            self.canvas.create_image(0, 0, anchor="nw", state="hidden", tags="piece")
+            for _ in self.engine.shape().blocks
+        ]
+        self.piece_item_type = None
+    
+    def draw_grid(self):
+        # Mettre à jour les blocs verrouillés (après un verrouillage ou un effacement
+        # de lignes) : seules les cases qui ont changé touchent au canvas
+        cells = self.engine.cells
+        block_items = self.block_items
+        for y in range(self.engine.height):
+            row = cells[y]
+            for x in range(self.engine.width):
+                piece_type = row[x]
+                drawn = block_items.get((x, y))
+                if drawn is None:
+                    if piece_type:
+                        item = self.canvas.create_image(
+                            x * self.grid_size, y * self.grid_size,
+                            image=self.block_sprites[piece_type],
+                            anchor="nw"
+                        )
+                        block_items[(x, y)] = (piece_type, item)
+                elif not piece_type:
+                    self.canvas.delete(drawn[1])
+                    del block_items[(x, y)]
+                elif drawn[0] != piece_type:
+                    self.canvas.itemconfig(drawn[1], image=self.block_sprites[piece_type])
+                    block_items[(x, y)] = (piece_type, drawn[1])
+    
+    def draw_current_piece(self):
+        # Placer les images de la pièce actuelle sur ses cases
+        engine = self.engine
+        if engine.game_over:
+            for item in self.piece_items + self.ghost_items:
+                self.canvas.itemconfig(item, state="hidden")
+            self.piece_item_type = None
+            return
+        
+        # Changer d'image uniquement quand une nouvelle pièce apparaît
+        if self.piece_item_type != engine.current_type:
+            for item in self.piece_items:
+                self.canvas.itemconfig(item, image=self.block_sprites[engine.current_type],
+                                       state="normal")
+            if self.show_ghost:
+                for item in self.ghost_items:
+                    self.canvas.itemconfig(item, image=self.ghost_sprites[engine.current_type],
+                                           state="normal")
+            self.piece_item_type = engine.current_type
+        
+        blocks = engine.shape().blocks
+        for item, (block_x, block_y) in zip(self.piece_items, blocks):
+            self.canvas.coords(
+                item,
+                (engine.current_x + block_x) * self.grid_size,
+                (engine.current_y + block_y) * self.grid_size
+            )
+        
+        # Pièce fantôme sur sa ligne d'arrivée (calculée d'après la hauteur des colonnes)
+        if self.show_ghost:
+            landing = engine.drop_row()
+            for item, (block_x, block_y) in zip(self.ghost_items, blocks):
+                self.canvas.coords(
+                    item,
+                    (engine.current_x + block_x) * self.grid_size,
+                    (landing + block_y) * self.grid_size
+                )
+
 
 class TetrisGame:
-    def __init__(self, root):
+    def __init__(self, root, seed=None, generator="bag"):
         self.root = root
         self.root.title("Tetris")
         self.root.resizable(False, False)
@@ -19,14 +219,37 @@ class TetrisGame:
         self.GAME_SPEED = 500  # Millisecondes entre chaque descente automatique
         self.SPEED_INCREASE = 50  # Réduction du délai à chaque niveau
         self.MIN_SPEED = 100  # Vitesse maximale
-        
-        # Variables du jeu
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.game_over = False
+        self.AI_MOVE_DELAY = 60  # Millisecondes entre deux actions de l'IA
+        self.LINE_CLEAR_FLASHES = 2  # Clignotements des lignes complètes
+        self.LINE_CLEAR_FRAME = 30  # Millisecondes par image du clignotement
+        self.FRAME_MS = 16  # Durée d'une image de la boucle de jeu
+        self.DAS_DELAY = 170  # Maintien avant la répétition automatique gauche/droite
+        self.ARR_DELAY = 50  # Délai entre deux décalages répétés (0 = jusqu'au bord)
+        self.SOFT_DROP_DELAY = 50  # Délai entre deux descentes quand Bas est maintenue
+        self.PREVIEW_COUNT = 3  # Pièces suivantes affichées (la première en grand)
+        self.SHOW_GHOST = True  # Afficher où la pièce va se poser
+        self.PIECE_GENERATOR = generator  # Tirage des pièces (voir tetris_engine.GENERATORS)
+        self.SEED = seed  # Graine fixe : chaque partie rejoue la même suite de pièces
+        
+        # Variables de l'interface (l'état de la partie est dans self.engine)
         self.game_started = False
         self.paused = False
+        self.clearing = None  # Lignes en cours d'effacement (animation)
+        self.clear_job = None  # Prochaine image de l'animation
+        
+        # Entrées : touches pressées/relâchées depuis la dernière image, traitées
+        # par game_loop (et gardées pendant l'effacement des lignes)
+        self.input_queue = []
+        self.keys_held = set()
+        self.shift_direction = 0  # -1 gauche, 1 droite, 0 aucun décalage maintenu
+        self.das_timer = 0
+        self.soft_drop_timer = 0
+        self.gravity_timer = 0
+        self.piece_dirty = False  # La pièce a bougé depuis le dernier rendu
+        self.ai_enabled = False  # Par défaut, le joueur contrôle les pièces
+        self.ai_player = None  # Instance de l'IA
+        self.ai_job = None  # Prochaine action planifiée de l'IA
+        self.ai_plan = None  # (numéro de la pièce, placement visé)
         
         # Création du canvas principal
         self.canvas = tk.Canvas(root, width=self.WIDTH, height=self.HEIGHT, bg="black")
@@ -57,6 +280,24 @@ class TetrisGame:
         self.next_piece_canvas = tk.Canvas(self.info_frame, width=120, height=120, bg="black")
         self.next_piece_canvas.pack(pady=10)
         
+        # Pièces d'après, en petit
+        self.queue_canvas = tk.Canvas(self.info_frame, width=60 * (self.PREVIEW_COUNT - 1), height=60, bg="black")
+        self.queue_canvas.pack(pady=(0, 10))
+        
+        # Graine de la partie, pour pouvoir la rejouer (python tetris.py --seed ...)
+        self.seed_label = tk.Label(self.info_frame, text="", font=("Arial", 9), bg="#2F2F2F", fg="#AAAAAA")
+        self.seed_label.pack()
+        
+        # Option pour laisser l'IA jouer
+        self.ai_var = tk.BooleanVar(value=False)
+        self.ai_checkbox = tk.Checkbutton(self.info_frame, text="Jeu automatique (IA)",
+                                        variable=self.ai_var,
+                                        font=("Arial", 12),
+                                        bg="#2F2F2F", fg="white",
+                                        selectcolor="#3F3F3F",
+                                        command=self.start_autoplay)
+        self.ai_checkbox.pack(pady=10)
+        
         # Boutons de contrôle
         self.start_button = tk.Button(self.info_frame, text="Commencer", 
                                     font=("Arial", 12), command=self.start_game)
@@ -73,6 +314,9 @@ class TetrisGame:
         # Initialisation du jeu
         self.init_game()
         
+        # Boucle de jeu : entrées et gravité à chaque image, un seul rendu par image
+        self.loop = FixedTimestepLoop(root, self.game_loop, self.render_frame, self.FRAME_MS)
+        
         # Liaison des touches du clavier
         self.setup_bindings()
         
@@ -86,67 +330,13 @@ class TetrisGame:
             os.makedirs(sprites_dir)
         
         # Couleurs des pièces de Tetris
-        self.colors = {
-            "I": "#00FFFF",  # Cyan
-            "J": "#0000FF",  # Bleu
-            "L": "#FF7F00",  # Orange
-            "O": "#FFFF00",  # Jaune
-            "S": "#00FF00",  # Vert
-            "T": "#800080",  # Violet
-            "Z": "#FF0000"   # Rouge
-        }
-        
-        # Créer les sprites pour chaque type de bloc
-        self.block_sprites = {}
-        for piece_type, color in self.colors.items():
-            self.block_sprites[piece_type] = self.create_block_sprite(color)
-    
-    def create_block_sprite(self, color):
-        # Créer un sprite pour un bloc
-        block_size = self.GRID_SIZE - 2  # Légèrement plus petit pour voir la grille
-        img = Image.new("RGBA", (block_size, block_size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Dessiner le bloc avec un effet 3D
-        draw.rectangle([0, 0, block_size-1, block_size-1], fill=color)
-        
-        # Bord supérieur et gauche plus clair (effet de lumière)
-        lighter_color = self.lighten_color(color)
-        draw.line([(0, 0), (block_size-1, 0)], fill=lighter_color, width=2)  # Haut
-        draw.line([(0, 0), (0, block_size-1)], fill=lighter_color, width=2)  # Gauche
+        self.colors = dict(PIECE_COLORS)
         
-        # Bord inférieur et droit plus foncé (effet d'ombre)
-        darker_color = self.darken_color(color)
-        draw.line([(0, block_size-1), (block_size-1, block_size-1)], fill=darker_color, width=2)  # Bas
-        draw.line([(block_size-1, 0), (block_size-1, block_size-1)], fill=darker_color, width=2)  # Droite
-        
-        return ImageTk.PhotoImage(img)
-    
-    def lighten_color(self, color_hex):
-        # Convertir la couleur hex en RGB et la rendre plus claire
-        r = int(color_hex[1:3], 16)
-        g = int(color_hex[3:5], 16)
-        b = int(color_hex[5:7], 16)
-        
-        # Éclaircir
-        r = min(255, r + 50)
-        g = min(255, g + 50)
-        b = min(255, b + 50)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
-    def darken_color(self, color_hex):
-        # Convertir la couleur hex en RGB et la rendre plus foncée
-        r = int(color_hex[1:3], 16)
-        g = int(color_hex[3:5], 16)
-        b = int(color_hex[5:7], 16)
-        
-        # Assombrir
-        r = max(0, r - 50)
-        g = max(0, g - 50)
-        b = max(0, b - 50)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
+        # Créer les sprites pour chaque type de bloc (et en petit pour l'aperçu)
+        self.block_sprites, self.ghost_sprites = load_block_sprites(self.GRID_SIZE)
+        self.small_block_sprites = {}
+        for piece_type, color in self.colors.items():
+            self.small_block_sprites[piece_type] = create_block_sprite(color, self.GRID_SIZE // 2)
     
     def show_welcome_screen(self):
         # Afficher un écran d'accueil avec des instructions
@@ -165,6 +355,7 @@ class TetrisGame:
             "Flèche bas pour accélérer la descente",
             "Espace pour faire tomber instantanément",
             "P pour mettre en pause",
+            "Cochez 'Jeu automatique' pour regarder l'IA",
             "\nCliquez sur 'Commencer' pour jouer"
         ]
         
@@ -183,178 +374,230 @@ class TetrisGame:
             self.canvas.create_image(x, y, image=self.block_sprites[piece_type], anchor="nw")
     
     def init_game(self):
-        # Initialiser les variables du jeu
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.game_over = False
+        # Nouvelle partie : les règles et la grille sont gérées par le moteur
+        if hasattr(self, 'engine'):
+            self.engine.reset(self.SEED)
+        else:
+            self.engine = TetrisEngine(self.GRID_WIDTH, self.GRID_HEIGHT, self.SEED,
+                                       self.PIECE_GENERATOR, self.PREVIEW_COUNT)
+            self.board = BoardView(self.canvas, self.engine, self.GRID_SIZE,
+                                   self.block_sprites, self.ghost_sprites, self.SHOW_GHOST)
+        self.pieces = PIECES
+        self.seed_label.config(text=f"Graine: {self.engine.seed}")
         self.paused = False
-        
-        # Initialiser la grille de jeu (0 = vide, sinon contient le type de pièce)
-        self.grid = [[0 for _ in range(self.GRID_WIDTH)] for _ in range(self.GRID_HEIGHT)]
-        
-        # Définir les formes des pièces
-        self.pieces = {
-            "I": [[(0, 0), (0, 1), (0, 2), (0, 3)],
-                  [(0, 0), (1, 0), (2, 0), (3, 0)]],
-            "J": [[(0, 0), (1, 0), (1, 1), (1, 2)],
-                  [(0, 0), (0, 1), (1, 0), (2, 0)],
-                  [(0, 0), (0, 1), (0, 2), (1, 2)],
-                  [(0, 1), (1, 1), (2, 0), (2, 1)]],
-            "L": [[(0, 0), (0, 1), (0, 2), (1, 0)],
-                  [(0, 0), (1, 0), (2, 0), (2, 1)],
-                  [(0, 2), (1, 0), (1, 1), (1, 2)],
-                  [(0, 0), (0, 1), (1, 1), (2, 1)]],
-            "O": [[(0, 0), (0, 1), (1, 0), (1, 1)]],
-            "S": [[(0, 1), (0, 2), (1, 0), (1, 1)],
-                  [(0, 0), (1, 0), (1, 1), (2, 1)]],
-            "T": [[(0, 1), (1, 0), (1, 1), (1, 2)],
-                  [(0, 0), (1, 0), (1, 1), (2, 0)],
-                  [(0, 0), (0, 1), (0, 2), (1, 1)],
-                  [(0, 1), (1, 0), (1, 1), (2, 1)]],
-            "Z": [[(0, 0), (0, 1), (1, 1), (1, 2)],
-                  [(0, 1), (1, 0), (1, 1), (2, 0)]]
-        }
-        
-        # Générer la pièce actuelle et la suivante
-        self.generate_new_piece()
-        self.generate_next_piece()
+        self.draw_next_piece()
     
     def setup_bindings(self):
-        # Configurer les touches de contrôle
-        self.root.bind("<Left>", self.move_left)
-        self.root.bind("<Right>", self.move_right)
-        self.root.bind("<Down>", self.move_down)
-        self.root.bind("<Up>", self.rotate)
-        self.root.bind("<space>", self.drop)
+        # Configurer les touches de contrôle : appuis et relâchements sont mis en
+        # file et traités à l'image suivante
+        for key in ("Left", "Right", "Down", "Up", "space"):
+            self.root.bind(f"<KeyPress-{key}>", self.key_pressed)
+            self.root.bind(f"<KeyRelease-{key}>", self.key_released)
         self.root.bind("p", self.toggle_pause)
         self.root.bind("P", self.toggle_pause)
     
     def start_game(self):
         # Démarrer le jeu
         self.game_started = True
-        self.game_over = False
         
         # Changer l'apparence des boutons
         self.start_button.pack_forget()
         self.restart_button.pack(pady=10)
         
-        # Réinitialiser le jeu
+        # Réinitialiser le jeu (et démarrer la boucle de jeu)
         self.reset_game()
-        
-        # Démarrer la boucle de jeu
-        self.game_loop()
     
     def reset_game(self):
-        # Réinitialiser le jeu
+        # Réinitialiser le jeu (une animation en cours est abandonnée)
+        if self.clear_job is not None:
+            self.root.after_cancel(self.clear_job)
+            self.clear_job = None
+        self.clearing = None
+        self.clear_inputs()
+        self.gravity_timer = 0
         self.init_game()
-        self.score_label.config(text=f"Score: {self.score}")
-        self.level_label.config(text=f"Niveau: {self.level}")
-        self.lines_label.config(text=f"Lignes: {self.lines_cleared}")
-        self.draw_grid()
-        self.draw_current_piece()
+        self.update_labels()
+        self.board.draw_board()
+        self.board.draw_current_piece()
         self.draw_next_piece()
+        if self.game_started:
+            self.loop.start()
+        self.start_autoplay()
+    
+    def start_autoplay(self):
+        # Activer ou couper l'IA selon la case à cocher (relancé à chaque partie et reprise)
+        self.ai_enabled = self.ai_var.get()
+        if self.ai_job is not None:
+            self.root.after_cancel(self.ai_job)
+            self.ai_job = None
+        self.ai_plan = None
+        if self.ai_enabled and self.game_started:
+            if self.ai_player is None:
+                self.ai_player = TetrisAI()
+            self.ai_job = self.root.after(self.AI_MOVE_DELAY, self.ai_step)
     
-    def generate_new_piece(self):
-        # Générer une nouvelle pièce
-        if hasattr(self, 'next_piece_type'):
-            self.current_piece_type = self.next_piece_type
-            self.current_rotation = 0
+    def ai_step(self):
+        # Une action de l'IA : pivoter, se décaler d'une colonne ou faire tomber la pièce
+        self.ai_job = None
+        if not self.ai_enabled or not self.can_play():
+            return  # Relancée par start_autoplay (reprise, nouvelle partie)
+        
+        if self.clearing is None:
+            self.ai_action()
+        self.ai_job = self.root.after(self.AI_MOVE_DELAY, self.ai_step)
+    
+    def ai_action(self):
+        engine = self.engine
+        if self.ai_plan is None or self.ai_plan[0] != engine.pieces_locked:
+            # Nouvelle pièce : chercher le meilleur placement (avec la pièce suivante)
+            self.ai_plan = (engine.pieces_locked, self.ai_player.choose(engine))
+        target = self.ai_plan[1]
+        
+        if target is None:
+            self.drop()
+        elif engine.current_rotation != target[0]:
+            if engine.rotate():
+                self.piece_dirty = True
+            else:
+                self.drop()
+        elif engine.current_x != target[1]:
+            if engine.move(1 if target[1] > engine.current_x else -1):
+                self.piece_dirty = True
+            else:
+                self.drop()
         else:
-            self.current_piece_type = random.choice(list(self.pieces.keys()))
-            self.current_rotation = 0
-        
-        # Position initiale (centrée en haut)
-        self.current_x = self.GRID_WIDTH // 2 - 1
-        self.current_y = 0
-        
-        # Vérifier si la nouvelle pièce peut être placée
-        if not self.is_valid_position():
-            self.game_over = True
+            self.drop()
     
-    def generate_next_piece(self):
-        # Générer la pièce suivante
-        self.next_piece_type = random.choice(list(self.pieces.keys()))
-        self.draw_next_piece()
+    def update_labels(self):
+        engine = self.engine
+        self.score_label.config(text=f"Score: {engine.score}")
+        self.level_label.config(text=f"Niveau: {engine.level}")
+        self.lines_label.config(text=f"Lignes: {engine.lines_cleared}")
     
-    def get_current_piece_shape(self):
-        # Obtenir la forme actuelle de la pièce en fonction de sa rotation
-        return self.pieces[self.current_piece_type][self.current_rotation % len(self.pieces[self.current_piece_type])]
+    def can_play(self):
+        return self.game_started and not self.engine.game_over and not self.paused
     
-    def is_valid_position(self, x=None, y=None, rotation=None):
-        # Vérifier si la position est valide (pas de collision avec les bords ou d'autres pièces)
-        if x is None:
-            x = self.current_x
-        if y is None:
-            y = self.current_y
-        if rotation is None:
-            rotation = self.current_rotation
-        
-        # Obtenir la forme de la pièce avec la rotation spécifiée
-        shape = self.pieces[self.current_piece_type][rotation % len(self.pieces[self.current_piece_type])]
-        
-        for block_x, block_y in shape:
-            # Calculer la position absolue du bloc
-            grid_x = x + block_x
-            grid_y = y + block_y
-            
-            # Vérifier si le bloc est dans les limites de la grille
-            if grid_x < 0 or grid_x >= self.GRID_WIDTH or grid_y < 0 or grid_y >= self.GRID_HEIGHT:
-                return False
+    def key_pressed(self, event):
+        if self.can_play():
+            self.input_queue.append(("press", event.keysym, event.time))
+    
+    def key_released(self, event):
+        if self.can_play():
+            self.input_queue.append(("release", event.keysym, event.time))
+    
+    def clear_inputs(self):
+        # Oublier les touches (nouvelle partie, reprise : un relâchement a pu être manqué)
+        self.input_queue = []
+        self.keys_held = set()
+        self.shift_direction = 0
+    
+    def process_inputs(self):
+        # Traiter les touches de l'image dans l'ordre ; si une ligne est effacée,
+        # les suivantes attendent la fin de l'animation
+        queue = self.input_queue
+        while queue and self.clearing is None and self.can_play():
+            kind, key, time = queue.pop(0)
+            if kind == "release":
+                # Répétition du système (X11) : relâchement suivi d'un appui de la même
+                # touche au même instant (deux appuis rapides restent deux appuis)
+                if queue and queue[0] == ("press", key, time):
+                    queue.pop(0)
+                    continue
+                self.keys_held.discard(key)
+                if key in ("Left", "Right") and self.shift_direction == (-1 if key == "Left" else 1):
+                    # Revenir à l'autre direction si elle est encore maintenue
+                    other = "Right" if key == "Left" else "Left"
+                    self.start_shift(0 if other not in self.keys_held else (-1 if other == "Left" else 1),
+                                     move=False)
+                continue
             
-            # Vérifier s'il y a déjà un bloc à cette position
-            if grid_y >= 0 and self.grid[grid_y][grid_x] != 0:
-                return False
-        
-        return True
+            if key in self.keys_held:
+                continue  # Répétition du système sans relâchement (Windows, macOS)
+            self.keys_held.add(key)
+            if key == "Left":
+                self.start_shift(-1)
+            elif key == "Right":
+                self.start_shift(1)
+            elif key == "Down":
+                self.soft_drop_timer = 0
+                self.move_down()
+            elif key == "Up":
+                self.rotate()
+            elif key == "space":
+                self.drop()
+    
+    def start_shift(self, direction, move=True):
+        # La dernière direction pressée l'emporte ; le délai DAS repart de zéro
+        self.shift_direction = direction
+        self.das_timer = 0
+        if direction and move:
+            self.shift(direction)
+    
+    def shift(self, direction):
+        if direction < 0:
+            self.move_left()
+        else:
+            self.move_right()
+    
+    def auto_repeat(self):
+        # Décalage automatique (DAS puis ARR) et descente rapide tant que les touches sont maintenues
+        if self.shift_direction:
+            self.das_timer += self.FRAME_MS
+            if self.das_timer >= self.DAS_DELAY:
+                if self.ARR_DELAY == 0:
+                    while self.engine.move(self.shift_direction):
+                        self.piece_dirty = True
+                else:
+                    while self.das_timer >= self.DAS_DELAY:
+                        self.shift(self.shift_direction)
+                        self.das_timer -= self.ARR_DELAY
+        
+        if "Down" in self.keys_held:
+            self.soft_drop_timer += self.FRAME_MS
+            pieces_locked = self.engine.pieces_locked
+            while self.soft_drop_timer >= self.SOFT_DROP_DELAY and self.can_play():
+                self.soft_drop_timer -= self.SOFT_DROP_DELAY
+                self.move_down()
+                if self.engine.pieces_locked != pieces_locked or self.clearing is not None:
+                    break
     
     def move_left(self, event=None):
         # Déplacer la pièce vers la gauche
-        if self.game_started and not self.game_over and not self.paused:
-            if self.is_valid_position(x=self.current_x - 1):
-                self.current_x -= 1
-                self.draw_grid()
-                self.draw_current_piece()
+        if self.can_play() and self.engine.move(-1):
+            self.piece_dirty = True
     
     def move_right(self, event=None):
         # Déplacer la pièce vers la droite
-        if self.game_started and not self.game_over and not self.paused:
-            if self.is_valid_position(x=self.current_x + 1):
-                self.current_x += 1
-                self.draw_grid()
-                self.draw_current_piece()
+        if self.can_play() and self.engine.move(1):
+            self.piece_dirty = True
     
     def move_down(self, event=None):
-        # Déplacer la pièce vers le bas
-        if self.game_started and not self.game_over and not self.paused:
-            if self.is_valid_position(y=self.current_y + 1):
-                self.current_y += 1
-                self.draw_grid()
-                self.draw_current_piece()
+        # Déplacer la pièce vers le bas (verrouillée si elle ne peut plus descendre)
+        if self.can_play():
+            # Descente manuelle : la gravité repart de zéro
+            self.gravity_timer = 0
+            cleared = self.engine.step_down()
+            if cleared is None:
+                self.piece_dirty = True
             else:
-                self.lock_piece()
+                self.piece_locked(cleared)
     
     def rotate(self, event=None):
         # Faire pivoter la pièce
-        if self.game_started and not self.game_over and not self.paused:
-            new_rotation = (self.current_rotation + 1) % len(self.pieces[self.current_piece_type])
-            if self.is_valid_position(rotation=new_rotation):
-                self.current_rotation = new_rotation
-                self.draw_grid()
-                self.draw_current_piece()
+        if self.can_play() and self.engine.rotate():
+            self.piece_dirty = True
     
     def drop(self, event=None):
         # Faire tomber la pièce instantanément
-        if self.game_started and not self.game_over and not self.paused:
-            while self.is_valid_position(y=self.current_y + 1):
-                self.current_y += 1
-            self.lock_piece()
+        if self.can_play():
+            self.piece_locked(self.engine.hard_drop())
     
     def toggle_pause(self, event=None):
         # Mettre en pause ou reprendre le jeu
-        if self.game_started and not self.game_over:
+        if self.game_started and not self.engine.game_over:
             self.paused = not self.paused
             if self.paused:
+                self.loop.pause()
                 self.canvas.create_text(self.WIDTH // 2, self.HEIGHT // 2, 
                                       text="PAUSE", 
                                       font=("Arial", 36, "bold"), 
@@ -362,132 +605,73 @@ class TetrisGame:
                                       tags="pause")
             else:
                 self.canvas.delete("pause")
-                self.game_loop()
+                self.clear_inputs()
+                self.loop.resume()
+                self.start_autoplay()
     
-    def lock_piece(self):
-        # Verrouiller la pièce en place et vérifier les lignes complètes
-        shape = self.get_current_piece_shape()
-        
-        for block_x, block_y in shape:
-            grid_x = self.current_x + block_x
-            grid_y = self.current_y + block_y
-            
-            if 0 <= grid_y < self.GRID_HEIGHT and 0 <= grid_x < self.GRID_WIDTH:
-                self.grid[grid_y][grid_x] = self.current_piece_type
-        
-        # Vérifier si une brique touche le haut de l'écran (première ligne)
-        if any(self.grid[0][x] != 0 for x in range(self.GRID_WIDTH)):
-            self.game_over = True
-            self.show_game_over()
+    def piece_locked(self, cleared):
+        # Mettre à jour l'affichage après le verrouillage d'une pièce
+        if cleared:
+            self.update_labels()
+            # Animation de suppression des lignes (la suite attend sa fin)
+            self.start_line_clear(cleared)
             return
-        
-        # Vérifier et supprimer les lignes complètes
-        self.check_lines()
-        
-        # Générer une nouvelle pièce
-        self.generate_new_piece()
-        self.generate_next_piece()
-        
-        # Mettre à jour l'affichage
-        self.draw_grid()
-        self.draw_current_piece()
+        self.show_locked_board()
     
-    def check_lines(self):
-        # Vérifier les lignes complètes et les supprimer
-        lines_to_clear = []
-        
-        for y in range(self.GRID_HEIGHT):
-            if all(self.grid[y][x] != 0 for x in range(self.GRID_WIDTH)):
-                lines_to_clear.append(y)
-        
-        if not lines_to_clear:
+    def show_locked_board(self):
+        self.board.draw_grid()
+        self.board.draw_current_piece()
+        if self.engine.game_over:
+            self.show_game_over()
             return
-        
-        # Mettre à jour le score et le niveau
-        lines_count = len(lines_to_clear)
-        self.lines_cleared += lines_count
-        
-        # Système de score classique de Tetris
-        points_per_line = {1: 100, 2: 300, 3: 500, 4: 800}
-        self.score += points_per_line.get(lines_count, 100 * lines_count) * self.level
-        
-        # Mettre à jour le niveau (tous les 10 lignes)
-        self.level = self.lines_cleared // 10 + 1
-        
-        # Mettre à jour les labels
-        self.score_label.config(text=f"Score: {self.score}")
-        self.level_label.config(text=f"Niveau: {self.level}")
-        self.lines_label.config(text=f"Lignes: {self.lines_cleared}")
-        
-        # Animation de suppression des lignes
-        self.animate_line_clear(lines_to_clear)
-        
-        # Supprimer les lignes et faire descendre les blocs
-        for line in sorted(lines_to_clear):
-            del self.grid[line]
-            self.grid.insert(0, [0 for _ in range(self.GRID_WIDTH)])
+        self.draw_next_piece()
     
-    def animate_line_clear(self, lines):
-        # Animation simple pour la suppression des lignes
+    def start_line_clear(self, lines):
+        # Les lignes effacées clignotent en blanc ; la gravité est suspendue
+        # et les touches mises de côté jusqu'à la fin de l'animation
+        self.clearing = lines
         for line in lines:
-            for x in range(self.GRID_WIDTH):
-                self.canvas.create_rectangle(
-                    x * self.GRID_SIZE, line * self.GRID_SIZE,
-                    (x + 1) * self.GRID_SIZE, (line + 1) * self.GRID_SIZE,
-                    fill="white", outline="white"
-                )
-        
-        self.canvas.update()
-        self.root.after(100)  # Pause pour l'effet visuel
-    
-    def draw_grid(self):
-        # Dessiner la grille et les blocs verrouillés
-        self.canvas.delete("all")
-        
-        # Dessiner les lignes de la grille
-        for x in range(0, self.GRID_WIDTH * self.GRID_SIZE, self.GRID_SIZE):
-            self.canvas.create_line(x, 0, x, self.GRID_HEIGHT * self.GRID_SIZE, fill="#333333")
-        
-        for y in range(0, self.GRID_HEIGHT * self.GRID_SIZE, self.GRID_SIZE):
-            self.canvas.create_line(0, y, self.GRID_WIDTH * self.GRID_SIZE, y, fill="#333333")
-        
-        # Dessiner les blocs verrouillés
-        for y in range(self.GRID_HEIGHT):
-            for x in range(self.GRID_WIDTH):
-                if self.grid[y][x] != 0:
-                    piece_type = self.grid[y][x]
-                    self.canvas.create_image(
-                        x * self.GRID_SIZE, y * self.GRID_SIZE,
-                        image=self.block_sprites[piece_type],
-                        anchor="nw"
-                    )
+            self.canvas.create_rectangle(
+                0, line * self.GRID_SIZE,
+                self.GRID_WIDTH * self.GRID_SIZE, (line + 1) * self.GRID_SIZE,
+                fill="white", outline="white", tags="line_clear"
+            )
+        self.clear_frame = 1
+        self.clear_job = self.root.after(self.LINE_CLEAR_FRAME, self.line_clear_frame)
     
-    def draw_current_piece(self):
-        # Dessiner la pièce actuelle
-        if self.game_over:
+    def line_clear_frame(self):
+        # Une image de l'animation, planifiée avec after() pour ne pas bloquer Tk
+        self.clear_job = None
+        if self.clear_frame < self.LINE_CLEAR_FLASHES * 2:
+            state = "hidden" if self.clear_frame % 2 else "normal"
+            self.canvas.itemconfig("line_clear", state=state)
+            self.clear_frame += 1
+            self.clear_job = self.root.after(self.LINE_CLEAR_FRAME, self.line_clear_frame)
             return
         
-        shape = self.get_current_piece_shape()
-        
-        for block_x, block_y in shape:
-            x = (self.current_x + block_x) * self.GRID_SIZE
-            y = (self.current_y + block_y) * self.GRID_SIZE
-            
-            self.canvas.create_image(
-                x, y,
-                image=self.block_sprites[self.current_piece_type],
-                anchor="nw"
-            )
+        # Fin de l'animation : afficher la grille tassée et la nouvelle pièce ;
+        # game_loop reprend la gravité et les touches gardées à l'image suivante
+        self.canvas.delete("line_clear")
+        self.clearing = None
+        self.gravity_timer = 0
+        self.show_locked_board()
     
     def draw_next_piece(self):
-        # Dessiner la pièce suivante dans le panneau d'aperçu
+        # Dessiner les pièces suivantes : la première dans le panneau d'aperçu,
+        # les autres en petit en dessous
         self.next_piece_canvas.delete("all")
-        
-        if not hasattr(self, 'next_piece_type'):
-            return
-        
-        # Obtenir la forme de la pièce suivante (première rotation)
-        shape = self.pieces[self.next_piece_type][0]
+        self.queue_canvas.delete("all")
+        
+        upcoming = self.engine.preview()[:self.PREVIEW_COUNT]
+        self.draw_preview_piece(self.next_piece_canvas, upcoming[0], 0, 120,
+                                self.block_sprites, self.GRID_SIZE)
+        for slot, piece_type in enumerate(upcoming[1:]):
+            self.draw_preview_piece(self.queue_canvas, piece_type, slot * 60, 60,
+                                    self.small_block_sprites, self.GRID_SIZE // 2)
+    
+    def draw_preview_piece(self, canvas, piece_type, left, box_size, sprites, cell_size):
+        # Obtenir la forme de la pièce (première rotation)
+        shape = self.pieces[piece_type][0]
         
         # Calculer le centre pour l'affichage
         min_x = min(block_x for block_x, _ in shape)
@@ -498,42 +682,44 @@ class TetrisGame:
         width = max_x - min_x + 1
         height = max_y - min_y + 1
         
-        offset_x = (120 - width * self.GRID_SIZE) // 2
-        offset_y = (120 - height * self.GRID_SIZE) // 2
+        offset_x = left + (box_size - width * cell_size) // 2
+        offset_y = (box_size - height * cell_size) // 2
         
         for block_x, block_y in shape:
-            x = offset_x + (block_x - min_x) * self.GRID_SIZE
-            y = offset_y + (block_y - min_y) * self.GRID_SIZE
+            x = offset_x + (block_x - min_x) * cell_size
+            y = offset_y + (block_y - min_y) * cell_size
             
-            self.next_piece_canvas.create_image(
+            canvas.create_image(
                 x, y,
-                image=self.block_sprites[self.next_piece_type],
+                image=sprites[piece_type],
                 anchor="nw"
             )
     
     def game_loop(self):
-        # Boucle principale du jeu
-        if self.game_started and not self.game_over and not self.paused:
-            # Faire descendre la pièce automatiquement
-            if self.is_valid_position(y=self.current_y + 1):
-                self.current_y += 1
-            else:
-                self.lock_piece()
-                
-                # Vérifier si le jeu est terminé
-                if self.game_over:
-                    self.show_game_over()
-                    return
-            
-            # Mettre à jour l'affichage
-            self.draw_grid()
-            self.draw_current_piece()
-            
-            # Calculer la vitesse en fonction du niveau
-            speed = max(self.MIN_SPEED, self.GAME_SPEED - (self.level - 1) * self.SPEED_INCREASE)
-            
-            # Planifier la prochaine mise à jour
-            self.root.after(speed, self.game_loop)
+        # Une image de la boucle de jeu : touches, répétition automatique puis gravité
+        # (suspendue pendant l'effacement des lignes)
+        if self.engine.game_over:
+            self.loop.stop()
+            return
+        if not self.can_play() or self.clearing is not None:
+            return
+        
+        self.process_inputs()
+        self.auto_repeat()
+        if not self.can_play() or self.clearing is not None:
+            return
+        
+        # Faire descendre la pièce automatiquement selon la vitesse du niveau
+        speed = max(self.MIN_SPEED, self.GAME_SPEED - (self.engine.level - 1) * self.SPEED_INCREASE)
+        self.gravity_timer += self.FRAME_MS
+        if self.gravity_timer >= speed:
+            self.move_down()
+    
+    def render_frame(self, alpha):
+        # Un seul déplacement des images de la pièce par image, même après plusieurs touches
+        if self.piece_dirty:
+            self.piece_dirty = False
+            self.board.draw_current_piece()
     
     def show_game_over(self):
         # Afficher l'écran de fin de jeu
@@ -552,7 +738,7 @@ class TetrisGame:
         
         self.canvas.create_text(
             self.WIDTH // 2, self.HEIGHT // 2 + 10,
-            text=f"Score final: {self.score}",
+            text=f"Score final: {self.engine.score}",
             font=("Arial", 18),
             fill="white"
         )
@@ -566,6 +752,11 @@ class TetrisGame:
         )
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tetris")
+    parser.add_argument("--seed", type=int, help="graine fixe : rejouer la même suite de pièces")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="bag", help="tirage des pièces")
+    args = parser.parse_args()
+    
     root = tk.Tk()
-    game = TetrisGame(root)
+    game = TetrisGame(root, args.seed, args.generator)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,275 @@
+"""Joueur automatique de Tetris : recherche du meilleur placement de la pièce actuelle et de la suivante.
+
+Peut aussi jouer des parties sans affichage, réparties sur plusieurs processus :
+    python tetris_ai.py -n 100 -j 4
+"""
+import argparse
+import json
+import multiprocessing
+import time
+from tetris_engine import GENERATORS, TetrisEngine, build_shapes
+
+# Poids de l'heuristique (score d'un plateau = somme pondérée de ses caractéristiques)
+WEIGHTS = {
+    "lines": 0.76,        # Lignes effacées par le placement
+    "height": -0.51,      # Somme des hauteurs des colonnes
+    "holes": -0.36,       # Cases vides recouvertes par un bloc
+    "bumpiness": -0.18,   # Somme des écarts de hauteur entre colonnes voisines
+}
+
+LOSING_SCORE = float("-inf")
+
+
+def drop_placements(rows, piece_type, width, height):
+    """Placements obtenus en lâchant la pièce depuis le haut, pour chaque rotation et colonne.
+
+    Produit des tuples (rotation, x, y, masques).
+    """
+    # Au-dessus du plus haut bloc, toutes les lignes sont vides : inutile d'y tester la pièce
+    top = next((y for y, row in enumerate(rows) if row), height)
+    for rotation, shape in enumerate(build_shapes(width)[piece_type]):
+        start = max(0, top - shape.height)
+        last = height - shape.height
+        for x, masks in enumerate(shape.masks):
+            y = start
+            if any(rows[y + dy] & mask for dy, mask in masks):
+                continue  # La pièce ne peut même pas entrer dans la grille ici
+            while y < last and not any(rows[y + 1 + dy] & mask for dy, mask in masks):
+                y += 1
+            yield rotation, x, y, masks
+
+
+def place(rows, masks, y, full_row):
+    """Plateau après la pose de la pièce et l'effacement des lignes.
+
+    Retourne (lignes, nombre de lignes effacées), ou (None, 0) si la pièce touche
+    la première ligne (fin de partie, comme dans TetrisEngine.lock).
+    """
+    rows = rows[:]
+    for dy, mask in masks:
+        rows[y + dy] |= mask
+    if rows[0]:
+        return None, 0
+    kept = [row for row in rows if row != full_row]
+    cleared = len(rows) - len(kept)
+    if cleared:
+        rows = [0] * cleared + kept
+    return rows, cleared
+
+
+_POPCOUNT_CACHE = {}
+
+
+def popcount_table(width):
+    """Nombre de cases occupées pour chaque masque de ligne possible"""
+    table = _POPCOUNT_CACHE.get(width)
+    if table is None:
+        table = _POPCOUNT_CACHE[width] = [bin(mask).count("1") for mask in range(1 << width)]
+    return table
+
+
+def board_features(rows, width):
+    """Hauteur totale, trous et irrégularité d'un plateau"""
+    height = len(rows)
+    popcount = popcount_table(width)
+    heights = [0] * width
+    covered = 0
+    holes = 0
+    for y, row in enumerate(rows):
+        if covered:
+            # Cases vides sous un bloc déjà rencontré plus haut
+            holes += popcount[covered & ~row]
+        elif not row:
+            continue
+        new = row & ~covered
+        while new:
+            lowest = new & -new
+            heights[lowest.bit_length() - 1] = height - y
+            new ^= lowest
+        covered |= row
+    bumpiness = sum(abs(left - right) for left, right in zip(heights, heights[1:]))
+    return sum(heights), holes, bumpiness
+
+
+def evaluate(rows, lines, width, weights):
+    aggregate, holes, bumpiness = board_features(rows, width)
+    return (weights["lines"] * lines + weights["height"] * aggregate
+            + weights["holes"] * holes + weights["bumpiness"] * bumpiness)
+
+
+def best_followup(job):
+    """Meilleur score atteignable en plaçant la pièce suivante sur le plateau donné"""
+    rows, piece_type, lines, width, weights = job
+    height = len(rows)
+    full_row = (1 << width) - 1
+    best = LOSING_SCORE
+    for _, _, y, masks in drop_placements(rows, piece_type, width, height):
+        after, cleared = place(rows, masks, y, full_row)
+        if after is not None:
+            best = max(best, evaluate(after, lines + cleared, width, weights))
+    if best == LOSING_SCORE:
+        # La pièce suivante ne tient nulle part : juger le plateau actuel
+        best = evaluate(rows, lines, width, weights) - 1000
+    return best
+
+
+class TetrisAI:
+    """Choisit la rotation et la colonne de chaque pièce"""
+
+    def __init__(self, weights=None, lookahead=True, processes=1):
+        self.weights = dict(WEIGHTS, **(weights or {}))
+        self.lookahead = lookahead
+        # Pool de processus pour l'anticipation de la pièce suivante (1 = pas de pool)
+        self.processes = processes
+        self.pool = None
+
+    def candidates(self, engine):
+        """Placements possibles de la pièce actuelle : (rotation, x, plateau après la pose, lignes effacées)"""
+        width, full_row = engine.width, engine.full_row
+        candidates = []
+        for rotation, x, y, masks in drop_placements(engine.rows, engine.current_type, width, engine.height):
+            after, cleared = place(engine.rows, masks, y, full_row)
+            if after is not None:
+                candidates.append((rotation, x, after, cleared))
+        return candidates
+
+    def choose(self, engine):
+        """Retourne (rotation, x) du meilleur placement, ou None si aucun n'est possible"""
+        width = engine.width
+        candidates = self.candidates(engine)
+        if not candidates:
+            return None
+
+        if self.lookahead and engine.next_type:
+            jobs = [(after, engine.next_type, cleared, width, self.weights)
+                    for _, _, after, cleared in candidates]
+            scores = self.map(best_followup, jobs)
+        else:
+            scores = [evaluate(after, cleared, width, self.weights) for _, _, after, cleared in candidates]
+
+        # Premier meilleur score, pour un choix reproductible
+        best = max(range(len(candidates)), key=scores.__getitem__)
+        rotation, x, _, _ = candidates[best]
+        return rotation, x
+
+    def search(self, engine):
+        """choose() par étapes, pour répartir la recherche sur plusieurs images.
+
+        Générateur qui rend la main après chaque placement évalué ; sa valeur de
+        retour (StopIteration.value) est le choix de choose().
+        """
+        width, next_type = engine.width, engine.next_type
+        candidates = self.candidates(engine)
+        if not candidates:
+            return None
+
+        scores = []
+        for _, _, after, cleared in candidates:
+            if self.lookahead and next_type:
+                scores.append(best_followup((after, next_type, cleared, width, self.weights)))
+            else:
+                scores.append(evaluate(after, cleared, width, self.weights))
+            yield
+
+        best = max(range(len(candidates)), key=scores.__getitem__)
+        rotation, x, _, _ = candidates[best]
+        return rotation, x
+
+    def map(self, function, jobs):
+        if self.processes == 1:
+            return [function(job) for job in jobs]
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.processes)
+        processes = self.processes or multiprocessing.cpu_count()
+        return self.pool.map(function, jobs, chunksize=max(1, len(jobs) // (2 * processes)))
+
+    def play(self, engine):
+        """Amène la pièce au placement choisi puis la fait tomber ; retourne les lignes effacées"""
+        target = self.choose(engine)
+        if target is not None:
+            rotation, x = target
+            while engine.current_rotation != rotation and engine.rotate():
+                pass
+            while engine.current_x != x and engine.move(1 if x > engine.current_x else -1):
+                pass
+        return engine.hard_drop()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+
+
+def play_game(job):
+    """Joue une partie complète sans affichage et retourne son résultat"""
+    seed, generator, weights, lookahead, max_pieces, search_processes = job
+    engine = TetrisEngine(seed=seed, generator=generator)
+    ai = TetrisAI(weights, lookahead, search_processes)
+
+    start = time.perf_counter()
+    try:
+        while not engine.game_over and engine.pieces_locked < max_pieces:
+            ai.play(engine)
+    finally:
+        ai.close()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "score": engine.score,
+        "lines": engine.lines_cleared,
+        "level": engine.level,
+        "pieces": engine.pieces_locked,
+        "game_over": engine.game_over,
+        "elapsed": elapsed,
+    }
+
+
+def run_batch(games, seed=0, generator="bag", weights=None, lookahead=True, max_pieces=500, processes=None,
+              search_processes=1):
+    """Joue `games` parties aux graines successives et retourne les résultats"""
+    jobs = [(seed + i, generator, weights, lookahead, max_pieces, search_processes) for i in range(games)]
+    if processes == 1:
+        return [play_game(job) for job in jobs]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(play_game, jobs, chunksize=max(1, games // (4 * (processes or multiprocessing.cpu_count()))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parties de Tetris jouées par l'IA, sans affichage")
+    parser.add_argument("-n", "--games", type=int, default=20, help="nombre de parties")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="bag", help="tirage des pièces")
+    parser.add_argument("--max-pieces", type=int, default=500, help="nombre maximal de pièces par partie")
+    parser.add_argument("--no-lookahead", action="store_true", help="ne pas tenir compte de la pièce suivante")
+    parser.add_argument("--weights", help="poids de l'heuristique en JSON, ex. '{\"holes\": -0.5}'")
+    parser.add_argument("-j", "--processes", type=int, default=None,
+                        help="nombre de processus pour les parties (défaut : tous les cœurs)")
+    parser.add_argument("--search-processes", type=int, default=1,
+                        help="nombre de processus pour l'anticipation de la pièce suivante (avec -j 1)")
+    args = parser.parse_args()
+
+    weights = None
+    if args.weights:
+        weights = json.loads(args.weights)
+        unknown = set(weights) - set(WEIGHTS)
+        if unknown:
+            parser.error(f"poids inconnus : {', '.join(sorted(unknown))} (connus : {', '.join(WEIGHTS)})")
+    if args.search_processes != 1 and args.processes != 1:
+        parser.error("--search-processes nécessite -j 1 (pas de pool dans un pool)")
+
+    start = time.perf_counter()
+    results = run_batch(args.games, args.seed, args.generator, weights, not args.no_lookahead, args.max_pieces,
+                        args.processes, args.search_processes)
+    wall_time = time.perf_counter() - start
+
+    total_pieces = sum(result["pieces"] for result in results)
+    print(f"Parties : {len(results)} en {wall_time:.2f} s ({len(results) / wall_time:.2f} parties/s)")
+    print(f"Pièces : {total_pieces} ({total_pieces / wall_time:.0f} pièces/s)")
+    print(f"Score moyen : {sum(result['score'] for result in results) / len(results):.1f}, "
+          f"lignes moyennes : {sum(result['lines'] for result in results) / len(results):.1f}, "
+          f"perdues : {sum(result['game_over'] for result in results)}")
+
+
+if __name__ == "__main__":
+    main()
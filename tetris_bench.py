@@ -0,0 +1,305 @@
+"""Banc d'essai du moteur de Tetris, sans Tk : débit, effacement de lignes et mémoire, comparés à une référence.
+
+    python tetris_bench.py           # mesure et compare à benchmarks/tetris_baseline.json
+    python tetris_bench.py --save    # enregistre les mesures comme nouvelle référence
+    python tetris_bench.py --record  # réenregistre la partie de référence (jouée par l'IA)
+
+Le code de sortie est 1 si une mesure régresse au-delà de la tolérance ou si
+la partie enregistrée ne se rejoue plus à l'identique.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from tetris_engine import TetrisEngine, PIECE_TYPES
+from tetris_ai import TetrisAI
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+BASELINE_PATH = os.path.join(BENCH_DIR, "tetris_baseline.json")
+STREAM_PATH = os.path.join(BENCH_DIR, "tetris_stream.json")
+
+# Actions d'une partie enregistrée : un caractère par entrée
+ACTIONS = {
+    "L": lambda engine: engine.move(-1),
+    "R": lambda engine: engine.move(1),
+    "U": lambda engine: engine.rotate(),
+    "D": lambda engine: engine.step_down(),
+    "X": lambda engine: engine.hard_drop(),
+}
+
+
+def calibrate(count):
+    """Boucle Python fixe : les débits sont rapportés à sa vitesse pour comparer des machines différentes"""
+    total = 0
+    for i in range(count):
+        total += (i * 7) & 0x3FF
+    return count
+
+
+def bench_fits(count):
+    """Tests de collision sur un plateau à moitié rempli (toutes pièces, rotations, colonnes et lignes)"""
+    engine = TetrisEngine(seed=1)
+    rng = random.Random(1)
+    for y in range(engine.height // 2, engine.height):
+        # Lignes presque pleines, avec un ou deux trous
+        engine.rows[y] = engine.full_row & ~(1 << rng.randrange(engine.width)) & ~(1 << rng.randrange(engine.width))
+    positions = [(x, y, rotation, piece_type)
+                 for piece_type in PIECE_TYPES
+                 for rotation in range(len(engine.shapes[piece_type]))
+                 for x in range(-1, engine.width)
+                 for y in range(engine.height)]
+    fits = engine.fits
+    done = 0
+    while done < count:
+        for x, y, rotation, piece_type in positions:
+            fits(x, y, rotation, piece_type)
+        done += len(positions)
+    return done
+
+
+def bench_drop_row(count):
+    """Ligne d'arrivée de la pièce (chute, pièce fantôme) depuis le haut d'un plateau à moitié rempli"""
+    engine = TetrisEngine(seed=4)
+    rng = random.Random(4)
+    for y in range(engine.height // 2, engine.height):
+        engine.rows[y] = engine.full_row & ~(1 << rng.randrange(engine.width))
+    engine.compute_heights()
+    positions = [(piece_type, rotation, x)
+                 for piece_type in PIECE_TYPES
+                 for rotation in range(len(engine.shapes[piece_type]))
+                 for x in range(len(engine.shapes[piece_type][rotation].masks))]
+    done = 0
+    while done < count:
+        for piece_type, rotation, x in positions:
+            engine.current_type, engine.current_rotation, engine.current_x = piece_type, rotation, x
+            engine.drop_row()
+        done += len(positions)
+    return done
+
+
+def bench_placements(count):
+    """Flux synthétique : rotation et colonne tirées au hasard, puis chute (nouvelle partie si perdue)"""
+    engine = TetrisEngine(seed=2)
+    rng = random.Random(2)
+    for i in range(count):
+        for _ in range(rng.randrange(4)):
+            engine.rotate()
+        target = rng.randrange(engine.width)
+        while engine.current_x != target and engine.move(1 if target > engine.current_x else -1):
+            pass
+        engine.hard_drop()
+        if engine.game_over:
+            engine.reset(i)
+    return count
+
+
+def bench_line_clears(count):
+    """Un I vertical complète quatre lignes pleines sauf la première colonne (Tetris), en boucle"""
+    engine = TetrisEngine(seed=3)
+    rows = [0] * (engine.height - 4) + [engine.full_row & ~1] * 4
+    cells = [[0] * engine.width for _ in range(engine.height - 4)] + \
+            [[0] + ["O"] * (engine.width - 1) for _ in range(4)]
+    engine.rows = rows
+    heights = engine.compute_heights()
+    lines = 0
+    for _ in range(count):
+        engine.rows = rows[:]
+        engine.cells = [row[:] for row in cells]
+        engine.heights = heights[:]
+        engine.current_type, engine.current_rotation = "I", 0
+        engine.current_x, engine.current_y = 0, 0
+        lines += len(engine.hard_drop())
+    return lines
+
+
+def load_stream():
+    with open(STREAM_PATH) as f:
+        return json.load(f)
+
+
+def replay_stream(stream):
+    """Rejoue une partie enregistrée ; retourne le moteur dans son état final"""
+    engine = TetrisEngine(seed=stream["seed"], generator=stream["generator"])
+    for action in stream["actions"]:
+        ACTIONS[action](engine)
+    return engine
+
+
+def bench_replay(count):
+    stream = load_stream()
+    pieces = 0
+    for _ in range(count):
+        pieces += replay_stream(stream).pieces_locked
+    return pieces
+
+
+CALIBRATION_SIZE = 200000
+
+# Nom : (fonction, taille d'une mesure, unité du débit)
+BENCHMARKS = {
+    "fits": (bench_fits, 200000, "tests/s"),
+    "drop_row": (bench_drop_row, 100000, "chutes/s"),
+    "placements": (bench_placements, 5000, "placements/s"),
+    "line_clears": (bench_line_clears, 20000, "lignes/s"),
+    "replay": (bench_replay, 10, "pièces/s"),
+}
+
+
+def rate(function, size):
+    """Débit d'une exécution (opérations par seconde)"""
+    start = time.perf_counter()
+    done = function(size)
+    return done / (time.perf_counter() - start)
+
+
+def measure(function, size, repeat):
+    """Meilleurs débits sur `repeat` essais : brut, et rapporté à la calibration.
+
+    La calibration est mesurée juste avant chaque essai, pour que le rapport
+    suive les variations de vitesse de la machine pendant le banc.
+    """
+    best_rate = best_relative = 0.0
+    for _ in range(repeat):
+        calibration = rate(calibrate, CALIBRATION_SIZE)
+        trial = rate(function, size)
+        best_rate = max(best_rate, trial)
+        best_relative = max(best_relative, trial / calibration)
+    return best_rate, best_relative
+
+
+def peak_memory(function, size):
+    """Pic d'allocations Python pendant une exécution (Kio)"""
+    tracemalloc.start()
+    try:
+        function(max(1, size // 10))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def record_stream(seed=12345, pieces=1000, generator="bag"):
+    """Fait jouer l'IA et enregistre ses entrées, avec le résultat attendu au rejeu"""
+    engine = TetrisEngine(seed=seed, generator=generator)
+    ai = TetrisAI(lookahead=False)
+    actions = []
+    while not engine.game_over and engine.pieces_locked < pieces:
+        target = ai.choose(engine)
+        if target is not None:
+            rotation, x = target
+            while engine.current_rotation != rotation and engine.rotate():
+                actions.append("U")
+            while engine.current_x != x:
+                step = 1 if x > engine.current_x else -1
+                if not engine.move(step):
+                    break
+                actions.append("R" if step > 0 else "L")
+        # Une descente d'une ligne avant la chute, pour couvrir step_down
+        actions.append("D")
+        if engine.step_down() is None:
+            actions.append("X")
+            engine.hard_drop()
+    return {
+        "seed": seed,
+        "generator": generator,
+        "actions": "".join(actions),
+        "score": engine.score,
+        "lines": engine.lines_cleared,
+        "pieces": engine.pieces_locked,
+    }
+
+
+def run(names, repeat):
+    """Mesure chaque banc : débit brut, débit rapporté à la calibration et pic mémoire"""
+    calibration = max(rate(calibrate, CALIBRATION_SIZE) for _ in range(repeat))
+    results = {}
+    for name in names:
+        function, size, unit = BENCHMARKS[name]
+        best_rate, relative = measure(function, size, repeat)
+        results[name] = {
+            "rate": round(best_rate, 1),
+            "relative": relative,
+            "peak_kib": round(peak_memory(function, size), 1),
+            "unit": unit,
+        }
+    return calibration, results
+
+
+def compare(results, baseline, tolerance):
+    """Liste des régressions par rapport à la référence"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if result["relative"] < reference["relative"] * (1 - tolerance):
+            regressions.append(f"{name} : débit {result['relative'] / reference['relative']:.0%} de la référence")
+        # Petite marge fixe : les pics de quelques Kio varient d'une version de Python à l'autre
+        if result["peak_kib"] > reference["peak_kib"] * (1 + tolerance) + 16:
+            regressions.append(f"{name} : mémoire {result['peak_kib']:.0f} Kio (référence {reference['peak_kib']:.0f})")
+    return regressions
+
+
+def check_stream():
+    """La partie enregistrée doit se rejouer à l'identique (mêmes règles, même tirage)"""
+    stream = load_stream()
+    engine = replay_stream(stream)
+    got = (engine.score, engine.lines_cleared, engine.pieces_locked)
+    expected = (stream["score"], stream["lines"], stream["pieces"])
+    if got != expected:
+        return [f"rejeu : score/lignes/pièces {got} au lieu de {expected}"]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai du moteur de Tetris")
+    parser.add_argument("names", nargs="*", metavar="BANC",
+                        help=f"bancs à lancer (défaut : tous) parmi {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=5, help="essais par banc (le meilleur est gardé)")
+    parser.add_argument("--tolerance", type=float, default=0.35,
+                        help="écart toléré avec la référence avant d'échouer (0.35 = 35 %%)")
+    parser.add_argument("--save", action="store_true", help="enregistrer les mesures comme référence")
+    parser.add_argument("--record", action="store_true", help="réenregistrer la partie rejouée par le banc 'replay'")
+    args = parser.parse_args()
+    names = args.names or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"bancs inconnus : {', '.join(sorted(unknown))}")
+
+    if args.record:
+        stream = record_stream()
+        with open(STREAM_PATH, "w") as f:
+            json.dump(stream, f, indent=1)
+        print(f"Partie enregistrée : {stream['pieces']} pièces, {stream['lines']} lignes, score {stream['score']}")
+
+    failures = check_stream()
+    calibration, results = run(names, args.repeat)
+
+    for name, result in results.items():
+        print(f"{name:12} {result['rate']:>12,.0f} {result['unit']:13} "
+              f"(x{result['relative']:.3f} calibration)  pic {result['peak_kib']:8.1f} Kio")
+
+    if args.save:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump({"calibration": round(calibration, 1), "results": results}, f, indent=1)
+        print(f"Référence enregistrée dans {os.path.relpath(BASELINE_PATH)}")
+    elif os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+        failures += compare(results, baseline["results"], args.tolerance)
+    else:
+        print("Pas de référence : lancer avec --save pour en créer une")
+
+    if failures:
+        print("ÉCHEC")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
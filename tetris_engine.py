@@ -0,0 +1,332 @@
+"""Moteur de Tetris sans Tk : chaque ligne de la grille est un entier (bit x = colonne x)."""
+import random
+from collections import deque
+
+GRID_WIDTH = 10
+GRID_HEIGHT = 20
+
+# Formes des pièces : blocs (x, y) pour chaque rotation
+PIECES = {
+    "I": [[(0, 0), (0, 1), (0, 2), (0, 3)],
+          [(0, 0), (1, 0), (2, 0), (3, 0)]],
+    "J": [[(0, 0), (1, 0), (1, 1), (1, 2)],
+          [(0, 0), (0, 1), (1, 0), (2, 0)],
+          [(0, 0), (0, 1), (0, 2), (1, 2)],
+          [(0, 1), (1, 1), (2, 0), (2, 1)]],
+    "L": [[(0, 0), (0, 1), (0, 2), (1, 0)],
+          [(0, 0), (1, 0), (2, 0), (2, 1)],
+          [(0, 2), (1, 0), (1, 1), (1, 2)],
+          [(0, 0), (0, 1), (1, 1), (2, 1)]],
+    "O": [[(0, 0), (0, 1), (1, 0), (1, 1)]],
+    "S": [[(0, 1), (0, 2), (1, 0), (1, 1)],
+          [(0, 0), (1, 0), (1, 1), (2, 1)]],
+    "T": [[(0, 1), (1, 0), (1, 1), (1, 2)],
+          [(0, 0), (1, 0), (1, 1), (2, 0)],
+          [(0, 0), (0, 1), (0, 2), (1, 1)],
+          [(0, 1), (1, 0), (1, 1), (2, 1)]],
+    "Z": [[(0, 0), (0, 1), (1, 1), (1, 2)],
+          [(0, 1), (1, 0), (1, 1), (2, 0)]]
+}
+PIECE_TYPES = tuple(PIECES)
+
+# Système de score classique de Tetris (multiplié par le niveau)
+LINE_SCORES = {1: 100, 2: 300, 3: 500, 4: 800}
+
+# Type des cases des lignes de pénalité (mode versus)
+GARBAGE = "G"
+
+
+class RandomGenerator:
+    """Pièces tirées au hasard, indépendamment les unes des autres"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def next_piece(self):
+        return self.rng.choice(PIECE_TYPES)
+
+
+class BagGenerator(RandomGenerator):
+    """Sac de 7 : chaque série de 7 pièces contient une pièce de chaque type"""
+
+    def __init__(self, rng):
+        super().__init__(rng)
+        self.bag = []
+
+    def next_piece(self):
+        if not self.bag:
+            self.bag = list(PIECE_TYPES)
+            self.rng.shuffle(self.bag)
+        return self.bag.pop()
+
+
+class HistoryGenerator(RandomGenerator):
+    """Tirage qui évite les dernières pièces sorties (jusqu'à `rolls` nouveaux essais)"""
+
+    def __init__(self, rng, history=4, rolls=4):
+        super().__init__(rng)
+        self.history = deque(maxlen=history)
+        self.rolls = rolls
+
+    def next_piece(self):
+        for _ in range(self.rolls):
+            piece_type = super().next_piece()
+            if piece_type not in self.history:
+                break
+        self.history.append(piece_type)
+        return piece_type
+
+
+GENERATORS = {
+    "random": RandomGenerator,
+    "bag": BagGenerator,
+    "history": HistoryGenerator,
+}
+
+
+class Shape:
+    """Une rotation d'une pièce, précalculée pour une grille de largeur donnée"""
+
+    def __init__(self, blocks, grid_width):
+        self.blocks = blocks
+        self.width = max(x for x, _ in blocks) + 1
+        self.height = max(y for _, y in blocks) + 1
+        # Masque de chaque ligne de la pièce, en colonne 0
+        row_masks = [0] * self.height
+        for x, y in blocks:
+            row_masks[y] |= 1 << x
+        # (ligne relative, masque) pour chaque colonne de départ possible
+        self.masks = [tuple((dy, mask << x) for dy, mask in enumerate(row_masks))
+                      for x in range(grid_width - self.width + 1)]
+        # Blocs le plus bas et le plus haut de chaque colonne de la pièce, pour trouver
+        # où elle se pose et mettre à jour la hauteur des colonnes
+        self.bottoms = tuple(max(y for x, y in blocks if x == column) for column in range(self.width))
+        self.tops = tuple(min(y for x, y in blocks if x == column) for column in range(self.width))
+
+
+_SHAPES_CACHE = {}
+
+
+def build_shapes(grid_width):
+    """Rotations précalculées de toutes les pièces : {type: [Shape, ...]}"""
+    shapes = _SHAPES_CACHE.get(grid_width)
+    if shapes is None:
+        shapes = {piece_type: [Shape(blocks, grid_width) for blocks in rotations]
+                  for piece_type, rotations in PIECES.items()}
+        _SHAPES_CACHE[grid_width] = shapes
+    return shapes
+
+
+class TetrisEngine:
+    """État d'une partie de Tetris et ses règles, indépendants de l'affichage"""
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None, generator="bag", preview=1):
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.shapes = build_shapes(width)
+        self.generator_name = generator
+        self.preview_size = max(1, preview)  # Nombre de pièces suivantes connues à l'avance
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        # Une même graine (et un même générateur) redonne la même suite de pièces
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.generator = GENERATORS[self.generator_name](random.Random(seed))
+        self.queue = deque()
+        # Lignes de pénalité reçues, ajoutées en bas au prochain verrouillage sans ligne effacée
+        self.pending_garbage = 0
+        self.garbage_rng = random.Random(seed + 1)
+
+        self.score = 0
+        self.level = 1
+        self.lines_cleared = 0
+        self.pieces_locked = 0
+        self.game_over = False
+
+        # Occupation de chaque ligne (bitboard) et type de pièce de chaque case (0 = vide)
+        self.rows = [0] * self.height
+        self.cells = [[0] * self.width for _ in range(self.height)]
+        # Hauteur de chaque colonne (nombre de lignes jusqu'à son bloc le plus haut)
+        self.heights = [0] * self.width
+
+        # Générer la pièce actuelle et les suivantes
+        self.spawn()
+
+    @property
+    def next_type(self):
+        return self.queue[0]
+
+    def preview(self):
+        """Pièces suivantes, dans l'ordre où elles arriveront"""
+        return list(self.queue)
+
+    def spawn(self):
+        # La première pièce de la file devient la pièce actuelle, centrée en haut
+        while len(self.queue) <= self.preview_size:
+            self.queue.append(self.generator.next_piece())
+        self.current_type = self.queue.popleft()
+        self.current_rotation = 0
+        self.current_x = self.width // 2 - 1
+        self.current_y = 0
+
+        # Vérifier si la nouvelle pièce peut être placée
+        if not self.fits():
+            self.game_over = True
+
+    def shape(self, piece_type=None, rotation=None):
+        piece_type = piece_type or self.current_type
+        rotations = self.shapes[piece_type]
+        if rotation is None:
+            rotation = self.current_rotation
+        return rotations[rotation % len(rotations)]
+
+    def fits(self, x=None, y=None, rotation=None, piece_type=None):
+        """Indique si la pièce tient à cette position (bords et blocs déjà posés)"""
+        if x is None:
+            x = self.current_x
+        if y is None:
+            y = self.current_y
+        shape = self.shape(piece_type, rotation)
+        if x < 0 or y < 0 or x >= len(shape.masks) or y + shape.height > self.height:
+            return False
+        rows = self.rows
+        for dy, mask in shape.masks[x]:
+            if rows[y + dy] & mask:
+                return False
+        return True
+
+    def move(self, dx):
+        """Décale la pièce horizontalement ; retourne True si elle a bougé"""
+        if self.fits(x=self.current_x + dx):
+            self.current_x += dx
+            return True
+        return False
+
+    def rotate(self):
+        """Fait pivoter la pièce ; retourne True si la rotation était possible"""
+        rotation = (self.current_rotation + 1) % len(self.shapes[self.current_type])
+        if self.fits(rotation=rotation):
+            self.current_rotation = rotation
+            return True
+        return False
+
+    def step_down(self):
+        """Descend la pièce d'une ligne.
+
+        Retourne None si elle a bougé, sinon la verrouille et retourne la
+        liste (éventuellement vide) des lignes effacées.
+        """
+        if self.fits(y=self.current_y + 1):
+            self.current_y += 1
+            return None
+        return self.lock()
+
+    def compute_heights(self):
+        """Hauteurs des colonnes recalculées depuis les lignes (après un plateau chargé de l'extérieur)"""
+        heights = [0] * self.width
+        for y, row in enumerate(self.rows):
+            for x in range(self.width):
+                if row >> x & 1 and not heights[x]:
+                    heights[x] = self.height - y
+        self.heights = heights
+        return heights
+
+    def drop_row(self):
+        """Ligne où la pièce actuelle s'arrêterait en tombant.
+
+        Calculée d'après la hauteur des colonnes qu'elle couvre ; ligne par ligne
+        seulement si la pièce est glissée sous un bloc (sous un surplomb).
+        """
+        shape = self.shape()
+        x, y = self.current_x, self.current_y
+        landing = self.height - shape.height
+        for column, bottom in enumerate(shape.bottoms):
+            surface = self.height - self.heights[x + column]  # Ligne du bloc le plus haut
+            if y + bottom >= surface:
+                # Sous un surplomb : descendre ligne par ligne
+                while self.fits(y=y + 1):
+                    y += 1
+                return y
+            landing = min(landing, surface - 1 - bottom)
+        return landing
+
+    def hard_drop(self):
+        """Fait tomber la pièce et la verrouille ; retourne les lignes effacées"""
+        self.current_y = self.drop_row()
+        return self.lock()
+
+    def lock(self):
+        """Pose la pièce actuelle, efface les lignes complètes et fait apparaître la suivante.
+
+        Retourne les indices (avant effacement) des lignes complètes.
+        """
+        shape = self.shape()
+        x, y = self.current_x, self.current_y
+        rows = self.rows
+        for dy, mask in shape.masks[x]:
+            rows[y + dy] |= mask
+        for block_x, block_y in shape.blocks:
+            self.cells[y + block_y][x + block_x] = self.current_type
+        heights = self.heights
+        for column, top in enumerate(shape.tops):
+            heights[x + column] = max(heights[x + column], self.height - (y + top))
+        self.pieces_locked += 1
+
+        # Une brique qui touche le haut de l'écran (première ligne) termine la partie
+        if rows[0]:
+            self.game_over = True
+            return []
+
+        cleared = self.clear_lines()
+        if not cleared and self.pending_garbage:
+            self.add_garbage(self.pending_garbage)
+            self.pending_garbage = 0
+            if self.game_over:
+                return cleared
+        self.spawn()
+        return cleared
+
+    def add_garbage(self, count):
+        """Pousse la grille vers le haut et ajoute `count` lignes pleines sauf une colonne"""
+        count = min(count, self.height)
+        # Des blocs poussés hors de la grille terminent la partie
+        if any(self.rows[:count]):
+            self.game_over = True
+        hole = self.garbage_rng.randrange(self.width)
+        row = self.full_row & ~(1 << hole)
+        self.rows = self.rows[count:] + [row] * count
+        self.cells = self.cells[count:] + [[0 if x == hole else GARBAGE for x in range(self.width)]
+                                           for _ in range(count)]
+        self.heights = [height + count if height else (0 if x == hole else count)
+                        for x, height in enumerate(self.heights)]
+
+    def clear_lines(self):
+        # Lignes complètes : comparaison directe avec le masque d'une ligne pleine
+        full = self.full_row
+        cleared = [y for y, row in enumerate(self.rows) if row == full]
+        if not cleared:
+            return cleared
+
+        # Supprimer les lignes et faire descendre celles du dessus
+        count = len(cleared)
+        self.rows = [0] * count + [row for row in self.rows if row != full]
+        kept = [cells for y, cells in enumerate(self.cells) if y not in cleared]
+        self.cells = [[0] * self.width for _ in range(count)] + kept
+
+        # Les lignes pleines passent sous le sommet de chaque colonne : les colonnes
+        # baissent d'autant, et plus encore si leur sommet était dans une ligne effacée
+        rows, heights = self.rows, self.heights
+        for x in range(self.width):
+            height = heights[x] - count
+            while height and not rows[self.height - height] >> x & 1:
+                height -= 1
+            heights[x] = height
+
+        # Mettre à jour le score et le niveau (tous les 10 lignes)
+        self.lines_cleared += count
+        self.score += LINE_SCORES.get(count, 100 * count) * self.level
+        self.level = self.lines_cleared // 10 + 1
+        return cleared
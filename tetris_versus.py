@@ -0,0 +1,403 @@
+"""Tetris à plusieurs : plateaux humains ou IA dans une même fenêtre, avec échange de lignes de pénalité.
+
+    python tetris_versus.py                         # un joueur contre l'IA
+    python tetris_versus.py --players 4 --humans 0  # borne : quatre IA
+    python tetris_versus.py --bench                 # durée d'une image selon le nombre de plateaux
+
+Tous les plateaux avancent dans la même boucle (un seul rappel after() par
+image) et seuls ceux qui ont changé sont redessinés.
+"""
+import argparse
+import random
+import time
+import tkinter as tk
+from tetris import BoardView, load_block_sprites
+from tetris_engine import GENERATORS, TetrisEngine
+from tetris_ai import TetrisAI
+from game_loop import FixedTimestepLoop
+
+# Lignes de pénalité envoyées selon le nombre de lignes effacées d'un coup
+ATTACK = {1: 0, 2: 1, 3: 2, 4: 4}
+
+# Touches des joueurs humains (keysym -> action), dans l'ordre des plateaux
+CONTROLS = [
+    {"Left": "left", "Right": "right", "Up": "rotate", "Down": "down", "space": "drop"},
+    {"q": "left", "d": "right", "z": "rotate", "s": "down", "a": "drop"},
+]
+CONTROLS_HELP = [
+    ["Flèches : déplacer", "Haut : pivoter", "Espace : chute"],
+    ["Q / D : déplacer", "Z : pivoter, S : descendre", "A : chute"],
+]
+
+
+class VersusPlayer:
+    """Un plateau du match : moteur, contrôle (touches ou IA), minuteries et parties à redessiner"""
+
+    def __init__(self, engine, ai=None):
+        self.engine = engine
+        self.ai = ai  # None : joueur humain
+        self.actions = []  # Touches du joueur humain depuis la dernière image
+        self.gravity_timer = 0
+        self.ai_timer = 0
+        self.ai_plan = None  # (numéro de la pièce, placement visé)
+        self.ai_search = None  # (numéro de la pièce, recherche en cours : TetrisAI.search)
+        self.sent = 0  # Lignes de pénalité envoyées
+        self.grid_dirty = self.piece_dirty = self.info_dirty = True
+
+
+class VersusMatch:
+    """Règles du match, sans Tk : mêmes pièces pour tous, attaques vers l'adversaire suivant encore en jeu"""
+
+    def __init__(self, players=2, humans=1, seed=None, generator="bag"):
+        self.FRAME_MS = 16  # Durée d'une image
+        self.GAME_SPEED = 500  # Millisecondes entre chaque descente automatique
+        self.SPEED_INCREASE = 50  # Réduction du délai à chaque niveau
+        self.MIN_SPEED = 100  # Vitesse maximale
+        self.AI_MOVE_DELAY = 60  # Millisecondes entre deux actions de l'IA
+        self.AI_SEARCH_STEPS = 8  # Placements évalués par l'IA à chaque image, tous plateaux confondus
+
+        ai = TetrisAI()
+        self.players = [VersusPlayer(TetrisEngine(seed=seed, generator=generator), None if index < humans else ai)
+                        for index in range(players)]
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        # Une graine commune : tous les plateaux reçoivent la même suite de pièces
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        for player in self.players:
+            player.engine.reset(seed)
+            player.actions = []
+            player.gravity_timer = player.ai_timer = player.sent = 0
+            player.ai_plan = player.ai_search = None
+            player.grid_dirty = player.piece_dirty = player.info_dirty = True
+        self.turn = 0  # Premier plateau servi à l'image suivante (tourne à chaque image)
+        self.finished = False
+
+    def alive(self):
+        return [index for index, player in enumerate(self.players) if not player.engine.game_over]
+
+    def winner(self):
+        """Indice du dernier plateau en jeu, ou None (match en cours, ou tous perdus)"""
+        alive = self.alive()
+        return alive[0] if self.finished and len(alive) == 1 else None
+
+    def step(self):
+        """Une image du match : touches, IA puis gravité de chaque plateau"""
+        if self.finished:
+            return
+        search_steps = self.AI_SEARCH_STEPS
+        count = len(self.players)
+        for offset in range(count):
+            index = (self.turn + offset) % count
+            player = self.players[index]
+            engine = player.engine
+            if engine.game_over:
+                continue
+
+            if player.ai is None:
+                actions, player.actions = player.actions, []
+                for action in actions:
+                    if engine.game_over:
+                        break
+                    self.act(index, action)
+            else:
+                if player.ai_plan is None or player.ai_plan[0] != engine.pieces_locked:
+                    search_steps = self.ai_search(index, search_steps)
+                player.ai_timer += self.FRAME_MS
+                if (player.ai_timer >= self.AI_MOVE_DELAY and player.ai_plan is not None
+                        and player.ai_plan[0] == engine.pieces_locked):
+                    player.ai_timer = 0
+                    self.ai_action(index)
+            if engine.game_over:
+                continue
+
+            # Faire descendre la pièce automatiquement selon la vitesse du niveau
+            speed = max(self.MIN_SPEED, self.GAME_SPEED - (engine.level - 1) * self.SPEED_INCREASE)
+            player.gravity_timer += self.FRAME_MS
+            if player.gravity_timer >= speed:
+                self.act(index, "down")
+        self.turn = (self.turn + 1) % count
+
+    def ai_search(self, index, steps):
+        """Avance la recherche de l'IA d'au plus `steps` placements ; retourne les étapes restantes.
+
+        La recherche est le seul calcul coûteux d'une image : elle est répartie sur
+        plusieurs images pour que leur durée ne dépende pas du nombre de plateaux
+        (l'IA joue un peu plus lentement quand beaucoup de plateaux cherchent à la fois).
+        """
+        player = self.players[index]
+        engine = player.engine
+        if player.ai_search is None or player.ai_search[0] != engine.pieces_locked:
+            # Première recherche pour cette pièce (ou pièce posée par la gravité entre-temps)
+            player.ai_search = (engine.pieces_locked, player.ai.search(engine))
+        search = player.ai_search[1]
+        while steps:
+            steps -= 1
+            try:
+                next(search)
+            except StopIteration as done:
+                player.ai_plan = (engine.pieces_locked, done.value)
+                player.ai_search = None
+                break
+        return steps
+
+    def ai_action(self, index):
+        # Une action de l'IA : pivoter, se décaler d'une colonne ou faire tomber la pièce
+        player = self.players[index]
+        engine = player.engine
+        target = player.ai_plan[1]
+        if target is None:
+            self.act(index, "drop")
+        elif engine.current_rotation != target[0]:
+            if engine.rotate():
+                player.piece_dirty = True
+            else:
+                self.act(index, "drop")
+        elif engine.current_x != target[1]:
+            if engine.move(1 if target[1] > engine.current_x else -1):
+                player.piece_dirty = True
+            else:
+                self.act(index, "drop")
+        else:
+            self.act(index, "drop")
+
+    def act(self, index, action):
+        """Applique une action ("left", "right", "rotate", "down" ou "drop") au plateau `index`"""
+        player = self.players[index]
+        engine = player.engine
+        if action == "left":
+            moved = engine.move(-1)
+        elif action == "right":
+            moved = engine.move(1)
+        elif action == "rotate":
+            moved = engine.rotate()
+        elif action == "down":
+            # Descente manuelle ou gravité : la gravité repart de zéro
+            player.gravity_timer = 0
+            cleared = engine.step_down()
+            if cleared is not None:
+                self.piece_locked(index, cleared)
+                return
+            moved = True
+        else:
+            self.piece_locked(index, engine.hard_drop())
+            return
+        if moved:
+            player.piece_dirty = True
+
+    def piece_locked(self, index, cleared):
+        # Les lignes effacées annulent d'abord la pénalité en attente, le reste attaque
+        player = self.players[index]
+        engine = player.engine
+        player.grid_dirty = player.piece_dirty = player.info_dirty = True
+
+        attack = ATTACK.get(len(cleared), len(cleared))
+        cancelled = min(attack, engine.pending_garbage)
+        engine.pending_garbage -= cancelled
+        attack -= cancelled
+        target = self.next_opponent(index)
+        if attack and target is not None:
+            opponent = self.players[target]
+            opponent.engine.pending_garbage += attack
+            opponent.info_dirty = True
+            player.sent += attack
+
+        alive = self.alive()
+        if len(alive) <= (1 if len(self.players) > 1 else 0):
+            self.finished = True
+
+    def next_opponent(self, index):
+        """Plateau suivant encore en jeu (dans l'ordre, en boucle), ou None"""
+        count = len(self.players)
+        for offset in range(1, count):
+            target = (index + offset) % count
+            if not self.players[target].engine.game_over:
+                return target
+        return None
+
+
+class VersusGame:
+    def __init__(self, root, players=2, humans=1, seed=None, generator="bag"):
+        self.root = root
+        self.root.title("Tetris Versus")
+        self.root.resizable(False, False)
+
+        # Constantes de l'affichage
+        self.GRID_SIZE = 24
+        self.SHOW_GHOST = True  # Afficher où les pièces vont se poser
+        self.SEED = seed  # Graine fixe : chaque match rejoue la même suite de pièces
+
+        self.match = VersusMatch(players, humans, seed, generator)
+        self.game_started = False
+        self.paused = False
+
+        # Touches des joueurs humains -> (plateau, action)
+        self.key_map = {}
+        for index, controls in enumerate(CONTROLS[:humans]):
+            for key, action in controls.items():
+                self.key_map[key] = (index, action)
+
+        self.block_sprites, self.ghost_sprites = load_block_sprites(self.GRID_SIZE)
+
+        # Un cadre par plateau : nom, grille et score
+        self.boards_frame = tk.Frame(root, bg="#2F2F2F")
+        self.boards_frame.pack()
+        self.board_width = self.match.players[0].engine.width * self.GRID_SIZE
+        self.board_height = self.match.players[0].engine.height * self.GRID_SIZE
+        self.canvases = []
+        self.views = []
+        self.info_labels = []
+        for index, player in enumerate(self.match.players):
+            frame = tk.Frame(self.boards_frame, bg="#2F2F2F")
+            frame.pack(side=tk.LEFT, padx=5, pady=5)
+            name = f"Joueur {index + 1}" if player.ai is None else f"IA {index + 1}"
+            tk.Label(frame, text=name, font=("Arial", 14), bg="#2F2F2F", fg="white").pack()
+            canvas = tk.Canvas(frame, width=self.board_width, height=self.board_height,
+                               bg="black", highlightthickness=0)
+            canvas.pack()
+            label = tk.Label(frame, text="", font=("Arial", 11), bg="#2F2F2F", fg="white", justify=tk.LEFT)
+            label.pack(pady=5)
+            self.canvases.append(canvas)
+            self.views.append(BoardView(canvas, player.engine, self.GRID_SIZE,
+                                        self.block_sprites, self.ghost_sprites, self.SHOW_GHOST))
+            self.info_labels.append(label)
+
+        # Graine et boutons
+        self.control_frame = tk.Frame(root, bg="#2F2F2F")
+        self.control_frame.pack(fill=tk.X)
+        self.seed_label = tk.Label(self.control_frame, text="", font=("Arial", 9), bg="#2F2F2F", fg="#AAAAAA")
+        self.seed_label.pack(side=tk.LEFT, padx=10)
+        self.start_button = tk.Button(self.control_frame, text="Commencer",
+                                      font=("Arial", 12), command=self.reset_game)
+        self.start_button.pack(side=tk.RIGHT, padx=10, pady=5)
+
+        # Une seule boucle pour tous les plateaux
+        self.loop = FixedTimestepLoop(root, self.game_loop, self.render_frame, self.match.FRAME_MS)
+
+        self.root.bind("<KeyPress>", self.key_pressed)
+        self.root.bind("p", self.toggle_pause)
+        self.root.bind("P", self.toggle_pause)
+
+        self.show_welcome_screen()
+
+    def show_welcome_screen(self):
+        # Touches de chaque joueur humain sur son plateau
+        for index, player in enumerate(self.match.players):
+            lines = CONTROLS_HELP[index] if player.ai is None else ["Joué par l'IA"]
+            for row, line in enumerate(lines):
+                self.canvases[index].create_text(self.board_width // 2, self.board_height // 3 + row * 25,
+                                                 text=line, font=("Arial", 11), fill="white")
+
+    def reset_game(self):
+        # Nouveau match : mêmes pièces pour tous, plateaux redessinés entièrement
+        self.game_started = True
+        self.paused = False
+        self.start_button.config(text="Nouvelle Partie")
+        self.match.reset(self.SEED)
+        self.seed_label.config(text=f"Graine: {self.match.seed}  (P : pause)")
+        for view in self.views:
+            view.draw_board()
+        self.render_frame(0)
+        self.loop.start()
+
+    def key_pressed(self, event):
+        target = self.key_map.get(event.keysym)
+        if target is not None and self.game_started and not self.paused and not self.match.finished:
+            index, action = target
+            self.match.players[index].actions.append(action)
+
+    def toggle_pause(self, event=None):
+        # Mettre en pause ou reprendre le match
+        if not self.game_started or self.match.finished:
+            return
+        self.paused = not self.paused
+        if self.paused:
+            self.loop.pause()
+            for canvas in self.canvases:
+                canvas.create_text(self.board_width // 2, self.board_height // 2,
+                                   text="PAUSE", font=("Arial", 24, "bold"), fill="white", tags="pause")
+        else:
+            for canvas in self.canvases:
+                canvas.delete("pause")
+            for player in self.match.players:
+                player.actions = []
+            self.loop.resume()
+
+    def game_loop(self):
+        # Une image pour tous les plateaux ; le match s'arrête quand il ne reste qu'un joueur
+        self.match.step()
+        if self.match.finished:
+            self.loop.stop()
+            self.render_frame(0)
+            self.show_result()
+
+    def render_frame(self, alpha):
+        # Seuls les plateaux qui ont changé depuis la dernière image touchent au canvas
+        for player, view, label, canvas in zip(self.match.players, self.views, self.info_labels, self.canvases):
+            if player.grid_dirty:
+                view.draw_grid()
+            if player.grid_dirty or player.piece_dirty:
+                view.draw_current_piece()
+            if player.info_dirty:
+                engine = player.engine
+                label.config(text=f"Score: {engine.score}  Lignes: {engine.lines_cleared}\n"
+                                  f"Envoyées: {player.sent}  En attente: {engine.pending_garbage}")
+            if player.grid_dirty and player.engine.game_over:
+                self.show_banner(canvas, "PERDU")
+            player.grid_dirty = player.piece_dirty = player.info_dirty = False
+
+    def show_result(self):
+        winner = self.match.winner()
+        if winner is not None:
+            self.show_banner(self.canvases[winner], "VICTOIRE")
+
+    def show_banner(self, canvas, text):
+        width, height = self.board_width, self.board_height
+        canvas.create_rectangle(10, height // 2 - 30, width - 10, height // 2 + 30,
+                                fill="#000000", outline="#FFFFFF", width=2)
+        canvas.create_text(width // 2, height // 2, text=text, font=("Arial", 20, "bold"), fill="white")
+
+
+def frame_times(players, frames=3000, seed=0):
+    """Durées (ms) des images d'un match entre IA, sans affichage"""
+    match = VersusMatch(players, 0, seed)
+    durations = []
+    for _ in range(frames):
+        if match.finished:
+            match.reset(seed + len(durations))
+        start = time.perf_counter()
+        match.step()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tetris à plusieurs")
+    parser.add_argument("--players", type=int, default=2, help="nombre de plateaux")
+    parser.add_argument("--humans", type=int, default=1, choices=range(len(CONTROLS) + 1),
+                        help="joueurs humains (les premiers plateaux), les autres sont joués par l'IA")
+    parser.add_argument("--seed", type=int, help="graine fixe : rejouer la même suite de pièces")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="bag", help="tirage des pièces")
+    parser.add_argument("--bench", action="store_true",
+                        help="mesurer la durée d'une image avec 1, 2, 4 et 8 plateaux d'IA, sans affichage")
+    args = parser.parse_args()
+    if args.players < 2 and not args.bench:
+        parser.error("il faut au moins deux plateaux")
+    if args.humans > args.players:
+        parser.error("plus de joueurs humains que de plateaux")
+
+    if args.bench:
+        for players in (1, 2, 4, 8):
+            durations = sorted(frame_times(players, seed=args.seed or 0))
+            print(f"{players} plateau(x) : moyenne {sum(durations) / len(durations):.3f} ms, "
+                  f"99e centile {durations[len(durations) * 99 // 100]:.3f} ms, max {durations[-1]:.3f} ms")
+        return
+
+    root = tk.Tk()
+    VersusGame(root, args.players, args.humans, args.seed, args.generator)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()